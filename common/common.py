@@ -141,6 +141,9 @@ from common.configure.configureShellEnv import (
     configureAndroidEnvironmentVariables,
     findNdkRoot,
 )
+from common.configure.ttlCache import (
+    TtlCache,
+)
 
 # Import and expose system orchestration modules
 from common.systems.configManager import (
@@ -265,6 +268,8 @@ __all__ = [
     "addToPath",
     "configureAndroidEnvironmentVariables",
     "findNdkRoot",
+    # Caching
+    "TtlCache",
     # System orchestration
     "ConfigManager",
     "ValidationEngine",
@@ -7,8 +7,6 @@ Supports wildcard patterns and HTTP caching with ETags.
 import json
 import os
 import re
-import urllib.error
-import urllib.request
 from typing import Optional, List, Tuple
 
 from common.core.logging import printError, printInfo, printWarning, printVerbose
@@ -62,6 +60,9 @@ def fetchGitHubRepos(
         - repo_list is None if 304 Not Modified (use cache)
         - etag and last_modified are cache metadata
     """
+    import urllib.error
+    import urllib.request
+
     # Map visibility to GitHub API type parameter
     typeMap = {
         "all": "all",
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Small JSON-backed key/value cache with per-entry expiry.
+Used by validation scripts to persist slow network lookups between runs.
+"""
+
+import json
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from common.core.logging import printVerbose, printWarning
+from common.configure.repoCache import getCacheDir
+
+
+class TtlCache:
+    """
+    Key/value cache stored as a JSON file in the jrl_env cache directory.
+
+    Entries older than the TTL are ignored on read. The file is loaded lazily on
+    first access and only written when save() is called. Safe to use from threads.
+    """
+
+    def __init__(self, fileName: str, ttl: timedelta, enabled: bool = True):
+        """
+        Initialise cache.
+
+        Args:
+            fileName: Cache file name within the jrl_env cache directory
+            ttl: Maximum age of entries returned by get()
+            enabled: If False, get() always misses and save() does nothing
+        """
+        self.fileName = fileName
+        self.ttl = ttl
+        self.enabled = enabled
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> Path:
+        """Path to the cache file."""
+        return getCacheDir() / self.fileName
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Load entries from disk (once), treating a missing or corrupt file as empty."""
+        if self._entries is None:
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self._entries = json.load(f)
+                printVerbose(f"Loaded cache from {self.path}")
+            except FileNotFoundError:
+                self._entries = {}
+            except Exception as e:
+                printWarning(f"Ignoring unreadable cache {self.fileName}: {e}")
+                self._entries = {}
+        return self._entries
+
+    def getEntry(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the raw entry for a key, regardless of age.
+
+        Returns:
+            Dictionary with "value" and "cachedAt", or None if absent
+        """
+        if not self.enabled:
+            return None
+        with self._lock:
+            return self._load().get(key)
+
+    def isFresh(self, entry: Dict[str, Any]) -> bool:
+        """Check if an entry is younger than the TTL."""
+        try:
+            return datetime.now() - datetime.fromisoformat(entry['cachedAt']) < self.ttl
+        except (KeyError, TypeError, ValueError):
+            return False
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a cached value if present and not expired.
+
+        Returns:
+            Cached value, or None on a miss
+        """
+        entry = self.getEntry(key)
+        if entry is None or not self.isFresh(entry):
+            return None
+        return entry.get('value')
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value (JSON-serialisable) with the current timestamp."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._load()[key] = {
+                'value': value,
+                'cachedAt': datetime.now().strftime("%Y-%m-%dT%H:%M:%S"),
+            }
+            self._dirty = True
+
+    def save(self) -> bool:
+        """
+        Write the cache to disk if anything changed.
+
+        Returns:
+            True if successful (or nothing to write), False otherwise
+        """
+        if not self.enabled:
+            return True
+        with self._lock:
+            if not self._dirty:
+                return True
+            try:
+                with open(self.path, 'w', encoding='utf-8') as f:
+                    json.dump(self._entries, f, indent=4, ensure_ascii=False)
+                self._dirty = False
+                printVerbose(f"Saved cache to {self.path}")
+                return True
+            except Exception as e:
+                printWarning(f"Failed to save cache {self.fileName}: {e}")
+                return False
+
+
+__all__ = [
+    "TtlCache",
+]
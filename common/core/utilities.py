@@ -9,8 +9,6 @@ import os
 import platform
 import shutil
 import sys
-import urllib.error
-import urllib.request
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -206,6 +204,9 @@ def hasInternetConnectivity(timeout: int = 5) -> bool:
     Returns:
         True if internet connectivity is available, False otherwise
     """
+    import urllib.error
+    import urllib.request
+
     # Use GitHub API as it's reliable and we already use it for repository validation
     testUrl = "https://api.github.com"
 
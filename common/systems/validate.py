@@ -13,8 +13,6 @@ import json
 import re
 import subprocess
 import sys
-import urllib.error
-import urllib.request
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Optional, Tuple
@@ -292,6 +290,8 @@ def checkGitHubRepositoryViaApi(ownerRepo: str) -> tuple[Optional[bool], str]:
         None means we couldn't determine (network error, private repo, etc.)
     """
     import os
+    import urllib.error
+    import urllib.request
 
     apiUrl = f"https://api.github.com/repos/{ownerRepo}"
     isCi = os.getenv('CI') == 'true' or os.getenv('GITHUB_ACTIONS') == 'true'
@@ -382,6 +382,9 @@ def makeHttpRequest(url: str, userAgent: str = 'jrl_env-validator', timeout: int
         Tuple of (statusCode: int|None, errorMessage: str|None)
         If statusCode is not None, request succeeded. If errorMessage is not None, request failed.
     """
+    import urllib.error
+    import urllib.request
+
     try:
         req = urllib.request.Request(url)
         req.add_header('User-Agent', userAgent)
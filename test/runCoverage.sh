@@ -31,6 +31,7 @@ python3 -m coverage run --source=common -a test/test/testInstallApps.py
 python3 -m coverage run --source=common -a test/test/testSystemsConfig.py
 python3 -m coverage run --source=common -a test/test/testStepDefinitions.py
 python3 -m coverage run --source=common -a test/test/testWildcardRepos.py
+python3 -m coverage run --source=common -a test/test/testTtlCache.py
 
 echo ""
 echo "================================================================"
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the JSON-backed TTL cache.
+Tests expiry, persistence, and the disabled mode.
+"""
+
+import json
+import sys
+import tempfile
+import unittest
+from datetime import timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+# Add project root to path
+scriptDir = Path(__file__).parent.absolute()
+sys.path.insert(0, str(scriptDir.parent.parent))
+
+from common.core.utilities import getProjectRoot
+projectRoot = getProjectRoot()
+
+from common.configure.ttlCache import TtlCache
+
+
+class TestTtlCache(unittest.TestCase):
+    """Tests for TtlCache."""
+
+    def setUp(self):
+        """Redirect the cache directory to a temporary folder."""
+        self.tempDir = tempfile.TemporaryDirectory()
+        patcher = patch("common.configure.ttlCache.getCacheDir", return_value=Path(self.tempDir.name))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.tempDir.cleanup)
+
+    def testMissReturnsNone(self):
+        """Test that an unknown key misses."""
+        cache = TtlCache("test.json", timedelta(hours=1))
+        self.assertIsNone(cache.get("missing"))
+
+    def testSetThenGet(self):
+        """Test that a stored value is returned while fresh."""
+        cache = TtlCache("test.json", timedelta(hours=1))
+        cache.set("key", {"exists": True})
+        self.assertEqual(cache.get("key"), {"exists": True})
+
+    def testPersistsAcrossInstances(self):
+        """Test that saved values are visible to a new cache instance."""
+        cache = TtlCache("test.json", timedelta(hours=1))
+        cache.set("key", True)
+        self.assertTrue(cache.save())
+
+        reloaded = TtlCache("test.json", timedelta(hours=1))
+        self.assertTrue(reloaded.get("key"))
+
+    def testExpiredEntryMisses(self):
+        """Test that entries older than the TTL are ignored but still readable raw."""
+        cachePath = Path(self.tempDir.name) / "test.json"
+        cachePath.write_text(json.dumps({"key": {"value": True, "cachedAt": "2000-01-01T00:00:00"}}), encoding="utf-8")
+
+        cache = TtlCache("test.json", timedelta(days=7))
+        self.assertIsNone(cache.get("key"))
+        entry = cache.getEntry("key")
+        self.assertIsNotNone(entry)
+        self.assertFalse(cache.isFresh(entry))
+
+    def testCorruptFileTreatedAsEmpty(self):
+        """Test that an unreadable cache file is ignored."""
+        (Path(self.tempDir.name) / "test.json").write_text("{not json", encoding="utf-8")
+        cache = TtlCache("test.json", timedelta(hours=1))
+        self.assertIsNone(cache.get("key"))
+
+    def testDisabledCacheNeverHitsOrWrites(self):
+        """Test that a disabled cache ignores reads and writes."""
+        cache = TtlCache("test.json", timedelta(hours=1), enabled=False)
+        cache.set("key", True)
+        self.assertIsNone(cache.get("key"))
+        self.assertTrue(cache.save())
+        self.assertFalse((Path(self.tempDir.name) / "test.json").exists())
+
+
+def main():
+    """Run all tests."""
+    # Run tests with verbose output
+    loader = unittest.TestLoader()
+    suite = loader.loadTestsFromModule(sys.modules[__name__])
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+
+    # Return exit code based on results
+    return 0 if result.wasSuccessful() else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the Git config validation helpers.
+Tests name, email, GitHub username format, and defaults checks without touching the network.
+"""
+
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add project root and validation scripts to path
+scriptDir = Path(__file__).parent.absolute()
+sys.path.insert(0, str(scriptDir.parent.parent))
+sys.path.insert(0, str(scriptDir.parent / "validate"))
+
+from common.core.utilities import getProjectRoot
+projectRoot = getProjectRoot()
+
+from validateGitConfig import (
+    githubUsernameExists,
+    isValidEmail,
+    isWebFormCompatible,
+    validateGitConfig,
+)
+
+
+class TestWebFormCompatible(unittest.TestCase):
+    """Test web form name validation."""
+
+    def testAsciiName(self):
+        """Test that a plain ASCII name is accepted."""
+        self.assertTrue(isWebFormCompatible("Jane Doe"))
+
+    def testUnicodeLetters(self):
+        """Test that non-ASCII letters are accepted."""
+        self.assertTrue(isWebFormCompatible("Joël R. Langlois"))
+        self.assertTrue(isWebFormCompatible("李小龙"))
+
+    def testPunctuation(self):
+        """Test that hyphens, apostrophes, and periods are accepted."""
+        self.assertTrue(isWebFormCompatible("Seán O'Brien-Smith Jr."))
+
+    def testMarkupRejected(self):
+        """Test that markup characters are rejected."""
+        self.assertFalse(isWebFormCompatible("Jane <Doe>"))
+        self.assertFalse(isWebFormCompatible("Jane {Doe}"))
+
+    def testControlCharactersRejected(self):
+        """Test that control characters are rejected."""
+        self.assertFalse(isWebFormCompatible("Jane\x00Doe"))
+
+    def testUnderscoreRejected(self):
+        """Test that underscores (word characters but not letters) are rejected."""
+        self.assertFalse(isWebFormCompatible("jane_doe"))
+
+    def testEmptyRejected(self):
+        """Test that an empty name is rejected."""
+        self.assertFalse(isWebFormCompatible(""))
+
+
+class TestValidEmail(unittest.TestCase):
+    """Test email format validation."""
+
+    def testValidEmail(self):
+        """Test that a normal address is accepted."""
+        self.assertTrue(isValidEmail("jane.doe+git@example.co.uk"))
+
+    def testMissingAt(self):
+        """Test that an address without '@' is rejected."""
+        self.assertFalse(isValidEmail("jane.doe.example.com"))
+
+    def testMissingTld(self):
+        """Test that an address without a top-level domain is rejected."""
+        self.assertFalse(isValidEmail("jane@localhost"))
+
+    def testEmpty(self):
+        """Test that an empty address is rejected."""
+        self.assertFalse(isValidEmail(""))
+
+
+class TestGithubUsernameFormat(unittest.TestCase):
+    """Test GitHub username format checks (rejected before any API call)."""
+
+    def testEmptyUsername(self):
+        """Test that an empty username is rejected."""
+        exists, _ = githubUsernameExists("")
+        self.assertFalse(exists)
+
+    def testLeadingHyphen(self):
+        """Test that a leading hyphen is rejected."""
+        exists, message = githubUsernameExists("-jane")
+        self.assertFalse(exists)
+        self.assertEqual(message, "Invalid GitHub username format")
+
+    def testTooLong(self):
+        """Test that usernames over 39 characters are rejected."""
+        exists, message = githubUsernameExists("a" * 40)
+        self.assertFalse(exists)
+        self.assertEqual(message, "Invalid GitHub username format")
+
+
+class TestDefaultsValidation(unittest.TestCase):
+    """Test validation of the defaults section."""
+
+    def validateDefaults(self, defaults: dict) -> int:
+        """Write a config containing only defaults and validate it."""
+        with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False, encoding="utf-8") as f:
+            json.dump({"defaults": defaults}, f)
+        try:
+            return validateGitConfig(f.name)
+        finally:
+            Path(f.name).unlink()
+
+    def testValidDefaults(self):
+        """Test that known keys with allowed values pass."""
+        exitCode = self.validateDefaults({
+            "init.defaultBranch": "main",
+            "color.ui": "auto",
+            "pull.rebase": True,
+            "merge.ff": "only",
+            "fetch.parallel": "8",
+            "core.editor": "vim",
+        })
+        self.assertEqual(exitCode, 0)
+
+    def testInvalidEnumValue(self):
+        """Test that a value outside a key's allowed set fails."""
+        self.assertEqual(self.validateDefaults({"push.default": "sometimes"}), 1)
+
+    def testNegativeParallel(self):
+        """Test that a negative fetch.parallel fails."""
+        self.assertEqual(self.validateDefaults({"fetch.parallel": -1}), 1)
+
+    def testInvalidValueType(self):
+        """Test that non-scalar values fail."""
+        self.assertEqual(self.validateDefaults({"core.editor": ["vim"]}), 1)
+
+
+def main():
+    """Run all tests."""
+    # Run tests with verbose output
+    loader = unittest.TestLoader()
+    suite = loader.loadTestsFromModule(sys.modules[__name__])
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+
+    # Return exit code based on results
+    return 0 if result.wasSuccessful() else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
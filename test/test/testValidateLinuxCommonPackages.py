@@ -0,0 +1,592 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the linuxCommon package validator.
+Tests the fetch transports against a local HTTP server and package checks with stubbed fetches.
+"""
+
+import gzip
+import hashlib
+import json
+import sys
+import tempfile
+import threading
+import types
+import unittest
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlsplit
+
+# Add project root and validation scripts to path
+scriptDir = Path(__file__).parent.absolute()
+sys.path.insert(0, str(scriptDir.parent.parent))
+sys.path.insert(0, str(scriptDir.parent / "validate"))
+
+from common.core.utilities import getProjectRoot
+projectRoot = getProjectRoot()
+
+import validateLinuxCommonPackages
+from common.configure.ttlCache import TtlCache
+from validateLinuxCommonPackages import (
+    AptChecker,
+    FlatpakChecker,
+    PacmanChecker,
+    ZypperChecker,
+    _fetchUrl,
+    _fetchUrlHttp2,
+    _hostSlot,
+    _packageMatcher,
+    _readResponse,
+)
+
+# Trimmed packages.debian.org results; both pages echo the search term back
+DEBIAN_SEARCH_HIT = b"""<div id="psearchres">
+<p>You have searched for packages that names are exactly <em>vim</em> in all suites,
+all sections, and all architectures. Found <strong>1</strong> matching packages.</p>
+<h3>Package vim</h3>
+<ul><li class="bookworm"><a class="resultlink" href="/bookworm/vim">bookworm (stable)</a></li></ul>
+</div>"""
+DEBIAN_SEARCH_MISS = b"""<div id="psearchres">
+<p>You have searched for packages that names are exactly <em>vim</em> in all suites,
+all sections, and all architectures.</p>
+<p id="psearchnoresult">Sorry, your search gave no results</p>
+</div>"""
+# Trimmed software.opensuse.org results for the same searches
+OPENSUSE_SEARCH_HIT = b"""<input type="text" name="q" value="vim">
+<div class="card"><h4><a href="/package/vim">vim</a></h4></div>"""
+OPENSUSE_SEARCH_MISS = b"""<input type="text" name="q" value="vim">
+<p>No packages found matching your search for <strong>vim</strong>.</p>"""
+
+# A large, poorly compressible page with the result near the start
+LARGE_PAGE = DEBIAN_SEARCH_HIT + b"".join(hashlib.sha256(bytes([i % 256, i // 256])).hexdigest().encode() for i in range(20000))
+
+
+class PackageSiteHandler(BaseHTTPRequestHandler):
+    """Serves canned responses for the transport tests, over keep-alive connections."""
+
+    protocol_version = "HTTP/1.1"
+    requests = []
+
+    def do_GET(self):
+        """Answer a request by path."""
+        PackageSiteHandler.requests.append((self.command, self.path))
+        if self.path == "/pkg":
+            self.reply(200, DEBIAN_SEARCH_HIT)
+        elif self.path == "/moved":
+            self.reply(301, b"", {"Location": "/pkg"})
+        elif self.path == "/relative/moved":
+            self.reply(302, b"", {"Location": "../pkg"})
+        elif self.path == "/loop":
+            self.reply(302, b"", {"Location": "/loop"})
+        elif self.path == "/large.gz":
+            self.reply(200, gzip.compress(LARGE_PAGE), {"Content-Encoding": "gzip"})
+        elif self.path == "/error":
+            self.reply(503, b"unavailable")
+        else:
+            self.reply(404, b"not found")
+
+    do_HEAD = do_GET
+
+    def reply(self, status: int, body: bytes, headers: dict = None):
+        """Send a complete response."""
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        """Keep test output quiet."""
+
+
+class PackageSiteServer(ThreadingHTTPServer):
+    """Local package site; connections the client drops mid-response are expected."""
+
+    def handle_error(self, request, clientAddress):
+        """Ignore connection resets from the client."""
+
+
+class FetchTestCase(unittest.TestCase):
+    """Base class starting every test with an empty fetch cache."""
+
+    def setUp(self):
+        """Clear responses remembered by earlier tests."""
+        validateLinuxCommonPackages._fetchCache.clear()
+        self.addCleanup(validateLinuxCommonPackages._fetchCache.clear)
+
+
+class TestFetchCache(FetchTestCase):
+    """Test reuse of responses within a run."""
+
+    def fetchTwice(self, response):
+        """Fetch the same URL twice, returning the second result and the number of real fetches."""
+        with patch.object(validateLinuxCommonPackages, "_fetchUrlUncached", return_value=response) as fetch:
+            _fetchUrl("https://example.com/pkg")
+            result = _fetchUrl("https://example.com/pkg")
+        return result, fetch.call_count
+
+    def testFoundReused(self):
+        """Test that a successful response is fetched once."""
+        self.assertEqual(self.fetchTwice((200, b"body")), ((200, b"body"), 1))
+
+    def testNotFoundReused(self):
+        """Test that a definite not-found response is fetched once."""
+        self.assertEqual(self.fetchTwice((404, None)), ((404, None), 1))
+
+    def testFailuresRetried(self):
+        """Test that network errors and server errors are not remembered."""
+        self.assertEqual(self.fetchTwice((None, None))[1], 2)
+        self.assertEqual(self.fetchTwice((503, None))[1], 2)
+
+    def testLargeBodiesNotKept(self):
+        """Test that bodies over the normal response cap are not held."""
+        body = b"x" * (validateLinuxCommonPackages._MAX_RESPONSE_BYTES + 1)
+        self.assertEqual(self.fetchTwice((200, body))[1], 2)
+
+    def testCacheBounded(self):
+        """Test that the oldest responses are evicted once the cache is full."""
+        with patch.object(validateLinuxCommonPackages, "_fetchUrlUncached", return_value=(200, b"body")):
+            for index in range(validateLinuxCommonPackages._FETCH_CACHE_SIZE + 10):
+                _fetchUrl(f"https://example.com/{index}")
+        self.assertEqual(len(validateLinuxCommonPackages._fetchCache), validateLinuxCommonPackages._FETCH_CACHE_SIZE)
+
+
+class TestPackageMatcher(unittest.TestCase):
+    """Test matching package names in search result pages."""
+
+    def testDebianResultHeading(self):
+        """Test that the result heading is a hit and the echoed search term is not."""
+        self.assertIsNotNone(_packageMatcher("vim").search(DEBIAN_SEARCH_HIT))
+        self.assertIsNone(_packageMatcher("vim").search(DEBIAN_SEARCH_MISS))
+
+    def testOpenSusePackageLink(self):
+        """Test that a package link is a hit and the echoed search term is not."""
+        self.assertIsNotNone(_packageMatcher("vim").search(OPENSUSE_SEARCH_HIT))
+        self.assertIsNone(_packageMatcher("vim").search(OPENSUSE_SEARCH_MISS))
+
+    def testLongerNameNotMatched(self):
+        """Test that a package whose name merely starts with the search term is not a hit."""
+        self.assertIsNone(_packageMatcher("vi").search(DEBIAN_SEARCH_HIT))
+        self.assertIsNone(_packageMatcher("vi").search(OPENSUSE_SEARCH_HIT))
+
+    def testZypperCheck(self):
+        """Test that the zypper check follows the matcher on both pages."""
+        checker = ZypperChecker()
+        with patch.object(ZypperChecker, "fetchUrl", return_value=OPENSUSE_SEARCH_HIT):
+            self.assertTrue(checker.checkPackage("vim"))
+        with patch.object(ZypperChecker, "fetchUrl", return_value=OPENSUSE_SEARCH_MISS):
+            self.assertFalse(checker.checkPackage("vim"))
+
+
+class TestReadResponse(unittest.TestCase):
+    """Test incremental reading of response bodies."""
+
+    @staticmethod
+    def trackedChunks(data: bytes, size: int, consumed: list):
+        """Yield data in chunks, recording how many were taken."""
+        for start in range(0, len(data), size):
+            consumed.append(start)
+            yield data[start:start + size]
+
+    def testGzipStopsAtMatch(self):
+        """Test that a gzipped body stops being read once the pattern is seen."""
+        compressed = gzip.compress(LARGE_PAGE)
+        consumed = []
+        body = _readResponse(self.trackedChunks(compressed, 1024, consumed), "gzip", _packageMatcher("vim"))
+
+        self.assertIsNotNone(_packageMatcher("vim").search(body))
+        self.assertLess(len(consumed), len(compressed) // 1024)
+        self.assertTrue(LARGE_PAGE.startswith(body))
+
+    def testMatchAcrossChunks(self):
+        """Test that a pattern split across two chunks still stops the read."""
+        consumed = []
+        splitAt = DEBIAN_SEARCH_HIT.index(b"Package vim") + 4
+        body = _readResponse(self.trackedChunks(DEBIAN_SEARCH_HIT + b"x" * 4096, splitAt, consumed), "", _packageMatcher("vim"))
+        self.assertIsNotNone(_packageMatcher("vim").search(body))
+        self.assertEqual(len(consumed), 2)
+
+    def testMaxBytes(self):
+        """Test that reading stops at the byte cap when the pattern never appears."""
+        body = _readResponse(self.trackedChunks(LARGE_PAGE, 1024, []), "", _packageMatcher("emacs"), maxBytes=10000)
+        self.assertGreaterEqual(len(body), 10000)
+        self.assertLess(len(body), 10000 + 1024)
+
+
+class TestHostSlot(unittest.TestCase):
+    """Test the per-host request limit."""
+
+    def testOneSemaphorePerHost(self):
+        """Test that each host gets its own semaphore, shared by every caller."""
+        self.assertIs(_hostSlot("a.example.com"), _hostSlot("a.example.com"))
+        self.assertIsNot(_hostSlot("a.example.com"), _hostSlot("b.example.com"))
+
+    def testLimit(self):
+        """Test that no more than MAX_REQUESTS_PER_HOST slots can be held at once."""
+        slot = _hostSlot("limit.example.com")
+        for _ in range(validateLinuxCommonPackages.MAX_REQUESTS_PER_HOST):
+            self.assertTrue(slot.acquire(blocking=False))
+        self.assertFalse(slot.acquire(blocking=False))
+        for _ in range(validateLinuxCommonPackages.MAX_REQUESTS_PER_HOST):
+            slot.release()
+
+
+class TestKeepAliveFetch(FetchTestCase):
+    """Test the http.client transport against a local server."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Start the local package site."""
+        cls.server = PackageSiteServer(("127.0.0.1", 0), PackageSiteHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.host = f"127.0.0.1:{cls.server.server_address[1]}"
+        cls.baseUrl = f"http://{cls.host}"
+
+    @classmethod
+    def tearDownClass(cls):
+        """Stop the local package site."""
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        """Force the keep-alive transport and start from no connections or requests."""
+        super().setUp()
+        patcher = patch.object(validateLinuxCommonPackages, "_getHttp2Client", return_value=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(lambda: getattr(validateLinuxCommonPackages._connections, "pool", {}).clear())
+        PackageSiteHandler.requests = []
+
+    def testGet(self):
+        """Test that a successful response returns its body."""
+        self.assertEqual(_fetchUrl(f"{self.baseUrl}/pkg"), (200, DEBIAN_SEARCH_HIT))
+
+    def testHead(self):
+        """Test that a HEAD request only returns the status."""
+        self.assertEqual(_fetchUrl(f"{self.baseUrl}/pkg", method="HEAD"), (200, b""))
+        self.assertEqual(PackageSiteHandler.requests, [("HEAD", "/pkg")])
+
+    def testConnectionReused(self):
+        """Test that requests to the same host share one connection."""
+        pool = validateLinuxCommonPackages._connections.pool = {}
+        _fetchUrl(f"{self.baseUrl}/pkg")
+        connection = pool[("http", self.host)]
+        _fetchUrl(f"{self.baseUrl}/missing")
+        self.assertIs(pool[("http", self.host)], connection)
+        self.assertIsNotNone(connection.sock)
+
+    def testRedirects(self):
+        """Test that absolute and relative redirects are followed."""
+        self.assertEqual(_fetchUrl(f"{self.baseUrl}/moved"), (200, DEBIAN_SEARCH_HIT))
+        self.assertEqual(_fetchUrl(f"{self.baseUrl}/relative/moved"), (200, DEBIAN_SEARCH_HIT))
+
+    def testRedirectLoop(self):
+        """Test that a redirect loop gives up after _MAX_REDIRECTS."""
+        self.assertEqual(_fetchUrl(f"{self.baseUrl}/loop"), (None, None))
+        self.assertEqual(len(PackageSiteHandler.requests), validateLinuxCommonPackages._MAX_REDIRECTS + 1)
+
+    def testErrorStatus(self):
+        """Test that an error status has no body."""
+        self.assertEqual(_fetchUrl(f"{self.baseUrl}/missing"), (404, None))
+        self.assertEqual(_fetchUrl(f"{self.baseUrl}/error"), (503, None))
+
+    def testUnreachable(self):
+        """Test that a connection failure is a None status."""
+        with patch.object(validateLinuxCommonPackages, "_sendRequest", side_effect=ConnectionRefusedError):
+            self.assertEqual(_fetchUrl(f"{self.baseUrl}/pkg"), (None, None))
+
+    def testGzipTruncatedAtStopAt(self):
+        """Test that a gzipped page is only read up to the first match."""
+        status, body = _fetchUrl(f"{self.baseUrl}/large.gz", stopAt=_packageMatcher("vim"))
+        self.assertEqual(status, 200)
+        self.assertIsNotNone(_packageMatcher("vim").search(body))
+        self.assertLess(len(body), 64 * 1024)
+
+        # The unread connection is dropped rather than reused mid-response
+        self.assertEqual(_fetchUrl(f"{self.baseUrl}/pkg"), (200, DEBIAN_SEARCH_HIT))
+
+    def testNotFoundCached(self):
+        """Test that a 404 is recorded in the response cache and answered from it next time."""
+        tempDir = tempfile.TemporaryDirectory()
+        self.addCleanup(tempDir.cleanup)
+        with patch("common.configure.ttlCache.getCacheDir", return_value=Path(tempDir.name)):
+            checker = ZypperChecker()
+            checker.responseCache = TtlCache("responses.json", timedelta(hours=24))
+            self.assertEqual(checker.requestUrl(f"{self.baseUrl}/missing"), (404, None))
+
+            validateLinuxCommonPackages._fetchCache.clear()
+            self.assertEqual(checker.requestUrl(f"{self.baseUrl}/missing"), (404, None))
+            self.assertEqual(len(PackageSiteHandler.requests), 1)
+
+            # Failures are not cached
+            checker.requestUrl(f"{self.baseUrl}/error")
+            checker.requestUrl(f"{self.baseUrl}/error")
+            self.assertEqual(len(PackageSiteHandler.requests), 3)
+
+
+class FakeHttp2Response:
+    """Stand-in for a streamed httpx response."""
+
+    def __init__(self, status: int, body: bytes, headers: dict = None):
+        self.status_code = status
+        self.is_success = 200 <= status < 300
+        self.headers = headers or {}
+        self.body = body
+
+    def iter_raw(self, size: int):
+        """Yield the raw body in chunks."""
+        for start in range(0, len(self.body), size):
+            yield self.body[start:start + size]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+
+class TestHttp2Fetch(unittest.TestCase):
+    """Test the HTTP/2 transport with a stubbed httpx client."""
+
+    def setUp(self):
+        """Provide a minimal httpx module, so the test runs whether or not httpx is installed."""
+        self.httpx = types.ModuleType("httpx")
+        self.httpx.HTTPError = type("HTTPError", (Exception,), {})
+        self.httpx.StreamError = type("StreamError", (Exception,), {})
+        patcher = patch.dict(sys.modules, {"httpx": self.httpx})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def fetch(self, response=None, error=None, stopAt=None, method="GET"):
+        """Fetch through a client returning the given response, or raising the given error."""
+        calls = []
+
+        class Client:
+            def stream(self, method, url, timeout):
+                calls.append((method, url))
+                if error is not None:
+                    raise error
+                return response
+
+        result = _fetchUrlHttp2(Client(), "https://example.com/pkg", 10, stopAt, validateLinuxCommonPackages._MAX_RESPONSE_BYTES, method)
+        return result, calls
+
+    def testSuccess(self):
+        """Test that a successful response returns its body."""
+        result, calls = self.fetch(FakeHttp2Response(200, DEBIAN_SEARCH_HIT))
+        self.assertEqual(result, (200, DEBIAN_SEARCH_HIT))
+        self.assertEqual(calls, [("GET", "https://example.com/pkg")])
+
+    def testGzipTruncatedAtStopAt(self):
+        """Test that a gzipped stream is only read up to the first match."""
+        response = FakeHttp2Response(200, gzip.compress(LARGE_PAGE), {"Content-Encoding": "gzip"})
+        (status, body), _ = self.fetch(response, stopAt=_packageMatcher("vim"))
+        self.assertEqual(status, 200)
+        self.assertLess(len(body), 64 * 1024)
+        self.assertIsNotNone(_packageMatcher("vim").search(body))
+
+    def testErrorStatus(self):
+        """Test that an error status has no body."""
+        self.assertEqual(self.fetch(FakeHttp2Response(404, b"not found"))[0], (404, None))
+
+    def testTransportError(self):
+        """Test that a client error is a None status."""
+        self.assertEqual(self.fetch(error=self.httpx.HTTPError("reset"))[0], (None, None))
+
+    def testUsedWhenAvailable(self):
+        """Test that _fetchUrl goes through the HTTP/2 client when there is one."""
+        client = object()
+        with patch.object(validateLinuxCommonPackages, "_getHttp2Client", return_value=client), \
+             patch.object(validateLinuxCommonPackages, "_fetchUrlHttp2", return_value=(200, b"body")) as fetch:
+            validateLinuxCommonPackages._fetchUrlUncached("https://example.com/pkg", 10, None, 1024, "GET")
+        self.assertIs(fetch.call_args.args[0], client)
+
+
+class TestAptIndex(unittest.TestCase):
+    """Test parsing of the APT suite package-name indices."""
+
+    INDEX = (
+        b"All Debian Packages in \"bookworm\"\n\n"
+        b"Generated: Sat Oct 17 00:00:00 2026 UTC\n"
+        b"0ad (0.0.26-3) Real-time strategy game of ancient warfare\n"
+        b"g++ (4:12.2.0-3) GNU C++ compiler\n"
+        b"libc6 (2.36-9) GNU C Library: Shared libraries\n"
+        b"vim (2:9.0.1378-2) Vi IMproved - enhanced vi editor\n"
+    )
+
+    def setUp(self):
+        """Capture warnings about indices that could not be loaded."""
+        patcher = patch.object(validateLinuxCommonPackages, "printWarning")
+        self.printWarning = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def loadIndex(self, *contents):
+        """Load the index from one stubbed download per suite."""
+        checker = AptChecker()
+        with patch.object(AptChecker, "fetchUrl", side_effect=list(contents)):
+            return checker.loadIndex()
+
+    def testNames(self):
+        """Test that every package name is read and descriptions are ignored."""
+        index = self.loadIndex(gzip.compress(self.INDEX), None)
+        self.assertEqual(index, frozenset({"0ad", "g++", "libc6", "vim"}))
+
+    def testSuitesMerged(self):
+        """Test that names from both suites are combined."""
+        index = self.loadIndex(gzip.compress(b"vim (1) editor\n"), gzip.compress(b"nano (1) editor\n"))
+        self.assertEqual(index, frozenset({"vim", "nano"}))
+
+    def testTruncatedDownload(self):
+        """Test that a download cut short still yields the complete lines before the cut."""
+        compressed = gzip.compress(self.INDEX + b"".join(b"pkg%d (1) filler package\n" % i for i in range(5000)))
+        index = self.loadIndex(compressed[:len(compressed) // 2], None)
+        self.assertTrue({"0ad", "g++", "libc6", "vim", "pkg0"} <= index)
+        self.assertNotIn("pkg4999", index)
+
+    def testAlreadyDecompressed(self):
+        """Test that an index the transport already gunzipped (Content-Encoding: gzip) is read as is."""
+        index = self.loadIndex(self.INDEX, gzip.compress(b"nano (1) editor\n"))
+        self.assertEqual(index, frozenset({"0ad", "g++", "libc6", "vim", "nano"}))
+
+    def testFailedIndexWarns(self):
+        """Test that an index which could not be loaded is reported."""
+        index = self.loadIndex(gzip.compress(self.INDEX), None)
+        self.assertIn("vim", index)
+        self.printWarning.assert_called_once()
+        self.assertIn(AptChecker.INDEX_URLS[1], self.printWarning.call_args.args[0])
+
+    def testCorruptDownload(self):
+        """Test that a download that is not gzip is skipped."""
+        self.assertEqual(self.loadIndex(b"<html>error</html>", None), frozenset())
+
+    def testCloseStopsSearches(self):
+        """Test that closing the checker shuts down its search threads."""
+        checker = AptChecker()
+        checker.close()
+        with self.assertRaises(RuntimeError):
+            checker._searchExecutor.submit(print)
+
+    def testLoadedOnce(self):
+        """Test that the indices are downloaded once per checker."""
+        checker = AptChecker()
+        with patch.object(AptChecker, "fetchUrl", return_value=gzip.compress(self.INDEX)) as fetch:
+            checker.loadIndex()
+            checker.loadIndex()
+        self.assertEqual(fetch.call_count, len(AptChecker.INDEX_URLS))
+
+
+class TestAptCheck(unittest.TestCase):
+    """Test APT checks: the suite indices first, then the search pages."""
+
+    def check(self, package: str, index: frozenset, pages: dict):
+        """Check a package with a stubbed index and search pages keyed by site."""
+        searched = []
+
+        def fetchUrl(self, url, timeout=10, stopAt=None, maxBytes=None):
+            searched.append(url)
+            return next((page for site, page in pages.items() if site in url), None)
+
+        checker = AptChecker()
+        self.addCleanup(checker.close)
+        with patch.object(AptChecker, "loadIndex", return_value=index), \
+             patch.object(AptChecker, "fetchUrl", fetchUrl):
+            return checker.checkPackage(package), searched
+
+    def testIndexHit(self):
+        """Test that a package in the index is found without searching."""
+        self.assertEqual(self.check("vim", frozenset({"vim"}), {}), (True, []))
+
+    def testIndexMissSearchMiss(self):
+        """Test that a package in neither the index nor the search results is missing."""
+        pages = {"ubuntu": DEBIAN_SEARCH_MISS, "debian": DEBIAN_SEARCH_MISS}
+        found, searched = self.check("vim", frozenset({"nano"}), pages)
+        self.assertFalse(found)
+        self.assertEqual(len(searched), 2)
+
+    def testIndexMissSearchHit(self):
+        """Test that a package found by either search (e.g. only in an older suite) is found."""
+        pages = {"ubuntu": DEBIAN_SEARCH_MISS, "debian": DEBIAN_SEARCH_HIT}
+        self.assertTrue(self.check("vim", frozenset({"nano"}), pages)[0])
+
+    def testSearchFailed(self):
+        """Test that a package is missing when the index and both searches have nothing."""
+        self.assertFalse(self.check("vim", frozenset(), {})[0])
+
+
+class TestFlatpakCheck(unittest.TestCase):
+    """Test Flathub checks."""
+
+    def check(self, content):
+        """Check an app with a stubbed reply, returning the result and the fetch calls."""
+        checker = FlatpakChecker()
+        with patch.object(FlatpakChecker, "fetchUrl", return_value=content) as fetchUrl:
+            return checker.checkPackage("org.mozilla.firefox"), fetchUrl.call_args_list
+
+    def testDocumentFound(self):
+        """Test that an appstream document is found with one small GET."""
+        found, calls = self.check(b'{"id": "org.mozilla.firefox", "name": "Firefox"}')
+        self.assertTrue(found)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(calls[0].kwargs["maxBytes"], FlatpakChecker.GET_MAX_BYTES)
+
+    def testShortBodyMissing(self):
+        """Test that a failed, empty or "null" reply means the app is missing."""
+        self.assertFalse(self.check(None)[0])
+        self.assertFalse(self.check(b"")[0])
+        self.assertFalse(self.check(b"null")[0])
+
+
+class TestPacmanBulkCheck(unittest.TestCase):
+    """Test bulk Arch package searches."""
+
+    REPOSITORY = {"bash", "git", "vim"}
+
+    def check(self, packages, honourAllNames=True):
+        """Check packages against a stubbed search, returning the results and requested URLs."""
+        requested = []
+
+        def fetchUrl(self, url, timeout=10, stopAt=None, maxBytes=None):
+            requested.append(url)
+            query = parse_qs(urlsplit(url).query)
+            names = query["name"] if honourAllNames else query["name"][-1:]
+            results = [{"pkgname": name} for name in names if name in TestPacmanBulkCheck.REPOSITORY]
+            return json.dumps({"results": results, "num_pages": 1}).encode()
+
+        with patch.object(PacmanChecker, "fetchUrl", fetchUrl):
+            return PacmanChecker().checkPackages(packages), requested
+
+    def testOneRequest(self):
+        """Test that packages found by the bulk search need no further requests."""
+        found, requested = self.check(["bash", "git", "vim"])
+        self.assertEqual(found, {"bash": True, "git": True, "vim": True})
+        self.assertEqual(len(requested), 1)
+
+    def testMissingConfirmed(self):
+        """Test that a package missing from the bulk search is confirmed with a single search."""
+        found, requested = self.check(["bash", "missing"])
+        self.assertEqual(found, {"bash": True, "missing": False})
+        self.assertEqual(len(requested), 2)
+
+    def testOnlyOneNameHonoured(self):
+        """Test that packages are still found if the server only applies one name parameter."""
+        found, _ = self.check(["bash", "git", "missing", "vim"], honourAllNames=False)
+        self.assertEqual(found, {"bash": True, "git": True, "missing": False, "vim": True})
+
+
+def main():
+    """Run all tests."""
+    # Run tests with verbose output
+    loader = unittest.TestLoader()
+    suite = loader.loadTestsFromModule(sys.modules[__name__])
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+
+    # Return exit code based on results
+    return 0 if result.wasSuccessful() else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
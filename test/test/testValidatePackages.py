@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the package validator.
+Tests config loading and linuxCommon merging without running any package manager.
+"""
+
+import json
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Add project root and validation scripts to path
+scriptDir = Path(__file__).parent.absolute()
+sys.path.insert(0, str(scriptDir.parent.parent))
+sys.path.insert(0, str(scriptDir.parent / "validate"))
+
+from common.core.utilities import getProjectRoot
+projectRoot = getProjectRoot()
+
+from validatePackages import (
+    AptChecker,
+    BrewChecker,
+    DnfChecker,
+    PackageValidator,
+    RpmChecker,
+    SnapChecker,
+    YumChecker,
+)
+
+
+class ValidatorTestCase(unittest.TestCase):
+    """Base class providing a temporary configs directory."""
+
+    def setUp(self):
+        """Create a temporary configs directory."""
+        self.tempDir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tempDir.cleanup)
+        self.configsDir = Path(self.tempDir.name)
+
+    def writeConfig(self, name: str, data: dict) -> Path:
+        """Write a JSON config into the temporary directory."""
+        path = self.configsDir / name
+        path.write_text(json.dumps(data), encoding="utf-8")
+        return path
+
+
+class TestGetPackageList(unittest.TestCase):
+    """Test reading package lists from a loaded config."""
+
+    def testList(self):
+        """Test that a list of names is returned as is."""
+        self.assertEqual(PackageValidator.getPackageList({"brew": ["git", "vim"]}, "brew"), ["git", "vim"])
+
+    def testMissingKey(self):
+        """Test that a missing key gives an empty list."""
+        self.assertEqual(PackageValidator.getPackageList({}, "brew"), [])
+
+    def testNotAList(self):
+        """Test that a non-list value gives an empty list."""
+        self.assertEqual(PackageValidator.getPackageList({"brew": "git"}, "brew"), [])
+
+    def testNonStringEntriesSkipped(self):
+        """Test that null and nested entries are not turned into package names."""
+        config = {"brew": ["git", None, {"name": "vim"}, ["nano"], "curl"]}
+        self.assertEqual(PackageValidator.getPackageList(config, "brew"), ["git", "curl"])
+
+
+class TestMergeLinuxCommon(ValidatorTestCase):
+    """Test merging linuxCommon packages into apt packages."""
+
+    def testMergeEnabled(self):
+        """Test that common and distro packages are merged and deduplicated."""
+        self.writeConfig("linuxCommon.json", {"linuxCommon": ["git", "curl"]})
+        configPath = self.writeConfig("debian.json", {"useLinuxCommon": True, "apt": ["vim", "git"]})
+
+        validator = PackageValidator(str(configPath))
+        self.assertEqual(validator.mergeLinuxCommon(), ["curl", "git", "vim"])
+
+    def testMergeDisabled(self):
+        """Test that only distro packages are used when merging is disabled."""
+        self.writeConfig("linuxCommon.json", {"linuxCommon": ["git", "curl"]})
+        configPath = self.writeConfig("debian.json", {"useLinuxCommon": False, "apt": ["vim"]})
+
+        validator = PackageValidator(str(configPath))
+        self.assertEqual(validator.mergeLinuxCommon(), ["vim"])
+
+
+    def testMalformedCommonSkipped(self):
+        """Test that an unparseable linuxCommon.json is skipped with a warning."""
+        (self.configsDir / "linuxCommon.json").write_text("{not json", encoding="utf-8")
+        configPath = self.writeConfig("debian.json", {"useLinuxCommon": True, "apt": ["vim"]})
+
+        validator = PackageValidator(str(configPath))
+        with patch("validatePackages.printWarning") as printWarning:
+            self.assertEqual(validator.mergeLinuxCommon(), ["vim"])
+        printWarning.assert_called_once()
+
+
+class TestValidate(ValidatorTestCase):
+    """Test validation of platform configs with a stubbed checker."""
+
+    def testCountsMissingPackages(self):
+        """Test that every configured package is checked and missing ones are counted."""
+        configPath = self.writeConfig("macos.json", {"brew": ["git", "missing", "vim"]})
+
+        with patch.object(BrewChecker, "isAvailable", return_value=True), \
+             patch.object(BrewChecker, "checkPackage", lambda self, package: package != "missing"):
+            validator = PackageValidator(str(configPath))
+            exitCode = validator.validate()
+
+        self.assertEqual(exitCode, 1)
+        self.assertEqual(validator.errors, 1)
+
+    def testAllPackagesFound(self):
+        """Test that a config whose packages all exist passes."""
+        configPath = self.writeConfig("macos.json", {"brew": ["git", "vim"]})
+
+        with patch.object(BrewChecker, "isAvailable", return_value=True), \
+             patch.object(BrewChecker, "checkPackage", return_value=True):
+            exitCode = PackageValidator(str(configPath)).validate()
+
+        self.assertEqual(exitCode, 0)
+
+    def testDuplicatesCheckedOnce(self):
+        """Test that a package listed twice is checked once but reported for each occurrence."""
+        configPath = self.writeConfig("macos.json", {"brew": ["missing", "git", "missing"]})
+        checked = []
+
+        def checkPackage(self, package):
+            checked.append(package)
+            return package != "missing"
+
+        with patch.object(BrewChecker, "isAvailable", return_value=True), \
+             patch.object(BrewChecker, "checkPackage", checkPackage):
+            validator = PackageValidator(str(configPath))
+            validator.validate()
+
+        self.assertEqual(sorted(checked), ["git", "missing"])
+        self.assertEqual(validator.errors, 2)
+
+
+class TestBatchQueries(unittest.TestCase):
+    """Test parsing the output of one query for many packages."""
+
+    DNF_OUTPUT = (
+        b"Available Packages\n"
+        b"Name         : git\n"
+        b"Version      : 2.46.0\n"
+        b"Summary      : Fast Version Control System\n"
+        b"\n"
+        b"Name         : vim-enhanced\n"
+        b"Epoch        : 2\n"
+        b"Summary      : A version of the VIM editor which includes recent enhancements\n"
+    )
+
+    def checkBatch(self, checker, packages, returncode, stdout, stderr=b""):
+        """Check packages with the batch query stubbed to return the given output."""
+        completed = subprocess.CompletedProcess([], returncode, stdout, stderr)
+        with patch.object(type(checker), "runBatchQuery", return_value=completed) as runBatchQuery, \
+             patch.object(type(checker), "checkPackage", side_effect=AssertionError("checked one at a time")):
+            found = checker.checkPackages(packages)
+        return found, runBatchQuery.call_args.args[0]
+
+    def testApt(self):
+        """Test that apt-cache show output is parsed despite its failing exit code."""
+        stdout = (
+            b"Package: git\nArchitecture: amd64\nVersion: 1:2.43.0-1ubuntu7\n\n"
+            b"Package: vim\nArchitecture: amd64\nVersion: 2:9.1.0016-1ubuntu7\nDepends: vim-common\n\n"
+        )
+        stderr = b"N: Unable to locate package missing\nE: No packages found\n"
+        found, command = self.checkBatch(AptChecker(), ["git", "missing", "vim"], 100, stdout, stderr)
+
+        self.assertEqual(found, {"git": True, "missing": False, "vim": True})
+        self.assertEqual(command, ["apt-cache", "show", "git", "missing", "vim"])
+
+    def testDnf(self):
+        """Test that dnf info output is parsed despite its failing exit code."""
+        stderr = b"Error: No matching Packages to list\n"
+        found, _ = self.checkBatch(DnfChecker(), ["git", "missing", "vim-enhanced"], 1, self.DNF_OUTPUT, stderr)
+        self.assertEqual(found, {"git": True, "missing": False, "vim-enhanced": True})
+
+    def testYum(self):
+        """Test that yum info output is parsed like dnf's."""
+        found, _ = self.checkBatch(YumChecker(), ["git", "vim"], 0, self.DNF_OUTPUT)
+        # "vim-enhanced" is not "vim"
+        self.assertEqual(found, {"git": True, "vim": False})
+
+    def testSnap(self):
+        """Test that snap info output is parsed despite its failing exit code."""
+        stdout = (
+            b"name:      firefox\nsummary:   Mozilla Firefox web browser\npublisher: Mozilla**\n"
+            b"---\n"
+            b"name:      code\nsummary:   Code editing. Redefined.\n"
+        )
+        stderr = b'error: no snap found for "missing"\n'
+        found, _ = self.checkBatch(SnapChecker(), ["code", "firefox", "missing"], 1, stdout, stderr)
+        self.assertEqual(found, {"code": True, "firefox": True, "missing": False})
+
+    def testRpm(self):
+        """Test that rpm -q output gives each installed name, and other entries are checked on their own."""
+        # What rpm prints for "bash", "bash-5.2.26-3.fc40", "coreutils.x86_64" and "missing"
+        stdout = b"bash\nbash\ncoreutils\npackage missing is not installed\n"
+        completed = subprocess.CompletedProcess([], 1, stdout, b"")
+        packages = ["bash", "bash-5.2.26-3.fc40", "coreutils.x86_64", "missing"]
+
+        with patch.object(RpmChecker, "runBatchQuery", return_value=completed) as runBatchQuery, \
+             patch.object(RpmChecker, "checkPackage", lambda self, package: package != "missing"):
+            found = RpmChecker().checkPackages(packages)
+
+        self.assertEqual(found, {"bash": True, "bash-5.2.26-3.fc40": True, "coreutils.x86_64": True, "missing": False})
+        self.assertEqual(runBatchQuery.call_args.args[0], ["rpm", "-q", "--queryformat", "%{NAME}\n"] + packages)
+
+    def testRpmCheckedOnceEach(self):
+        """Test that only entries missing from the batch output are checked again."""
+        completed = subprocess.CompletedProcess([], 1, b"bash\npackage missing is not installed\n", b"")
+        with patch.object(RpmChecker, "runBatchQuery", return_value=completed), \
+             patch.object(RpmChecker, "checkPackage", return_value=False) as checkPackage:
+            found = RpmChecker().checkPackages(["bash", "missing"])
+
+        self.assertEqual(found, {"bash": True, "missing": False})
+        checkPackage.assert_called_once_with("missing")
+
+    def testQueryFailedFallsBack(self):
+        """Test that packages are checked one at a time if the batch query cannot run."""
+        with patch.object(AptChecker, "runBatchQuery", return_value=None), \
+             patch.object(AptChecker, "checkPackage", lambda self, package: package == "vim"):
+            found = AptChecker().checkPackages(["vim", "missing"])
+        self.assertEqual(found, {"vim": True, "missing": False})
+
+    def testSinglePackageNotBatched(self):
+        """Test that one package is checked on its own."""
+        with patch.object(AptChecker, "runBatchQuery") as runBatchQuery, \
+             patch.object(AptChecker, "checkPackage", return_value=True):
+            self.assertEqual(AptChecker().checkPackages(["vim"]), {"vim": True})
+        runBatchQuery.assert_not_called()
+
+
+def main():
+    """Run all tests."""
+    # Run tests with verbose output
+    loader = unittest.TestLoader()
+    suite = loader.loadTestsFromModule(sys.modules[__name__])
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+
+    # Return exit code based on results
+    return 0 if result.wasSuccessful() else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,389 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the repositories config validator.
+Tests path and URL checks with the GitHub API and git ls-remote stubbed out.
+"""
+
+import http.client
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from datetime import timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+# Add project root and validation scripts to path
+scriptDir = Path(__file__).parent.absolute()
+sys.path.insert(0, str(scriptDir.parent.parent))
+sys.path.insert(0, str(scriptDir.parent / "validate"))
+
+from common.core.utilities import getProjectRoot
+projectRoot = getProjectRoot()
+
+import validateRepositories
+from common.configure.ttlCache import TtlCache
+from validateRepositories import (
+    _githubRequest,
+    canonicalizeRepoUrl,
+    checkGitHubRepositories,
+    checkGitHubRepository,
+    checkGitRepository,
+    checkRepository,
+    classifyRepoUrl,
+    convertSshToHttps,
+    probeSmartHttp,
+    validateUnixPath,
+    validateWindowsPath,
+)
+
+
+class TestWorkPaths(unittest.TestCase):
+    """Test work path syntax checks."""
+
+    def testUnixPaths(self):
+        """Test that Unix paths must start with ~, /, $HOME, or $USER."""
+        for path in ("~/work", "/opt/work", "$HOME/work", "$USER"):
+            self.assertTrue(validateUnixPath(path), path)
+        self.assertFalse(validateUnixPath("work"))
+
+    def testWindowsPaths(self):
+        """Test that Windows paths must start with a drive, UNC prefix, $USERPROFILE, or $HOME."""
+        for path in ("C:\\work", "\\\\server\\share", "$USERPROFILE\\work", "$HOME\\work"):
+            self.assertTrue(validateWindowsPath(path), path)
+        self.assertFalse(validateWindowsPath("work"))
+
+
+class TestConvertSshToHttps(unittest.TestCase):
+    """Test GitHub SSH to HTTPS conversion."""
+
+    def testGitHubSsh(self):
+        """Test that a GitHub SSH URL is converted and .git is dropped."""
+        self.assertEqual(convertSshToHttps("git@github.com:owner/repo.git"), "https://github.com/owner/repo")
+
+    def testOtherHost(self):
+        """Test that non-GitHub SSH URLs are not converted."""
+        self.assertIsNone(convertSshToHttps("git@gitlab.com:owner/repo.git"))
+
+
+class TestCanonicalizeRepoUrl(unittest.TestCase):
+    """Test repository URL canonicalisation."""
+
+    def testGitHubForms(self):
+        """Test that GitHub SSH and HTTPS forms of a repository match."""
+        expected = "https://github.com/owner/repo"
+        for url in ("git@github.com:owner/repo.git", "https://github.com/owner/repo", "https://GitHub.com/owner/repo.git/"):
+            self.assertEqual(canonicalizeRepoUrl(url), expected, url)
+
+    def testOtherSshUnchanged(self):
+        """Test that non-GitHub SSH URLs only lose their .git suffix."""
+        self.assertEqual(canonicalizeRepoUrl("git@gitlab.com:owner/repo.git"), "git@gitlab.com:owner/repo")
+
+
+class TestGitHubCache(unittest.TestCase):
+    """Test caching of GitHub API answers with ETag revalidation."""
+
+    def setUp(self):
+        """Use a fresh cache in a temporary directory."""
+        self.tempDir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tempDir.cleanup)
+        cacheDirPatcher = patch("common.configure.ttlCache.getCacheDir", return_value=Path(self.tempDir.name))
+        cacheDirPatcher.start()
+        self.addCleanup(cacheDirPatcher.stop)
+        self.cache = TtlCache("gh_repos.json", timedelta(hours=24))
+        cachePatcher = patch.object(validateRepositories, "_githubCache", self.cache)
+        cachePatcher.start()
+        self.addCleanup(cachePatcher.stop)
+
+    def testFreshEntrySkipsRequest(self):
+        """Test that a found repository is not requested again while fresh."""
+        with patch.object(validateRepositories, "_githubRequest", return_value=(200, '"abc"')) as request:
+            self.assertTrue(checkGitHubRepository("owner/repo")[0])
+            self.assertTrue(checkGitHubRepository("Owner/Repo")[0])
+        self.assertEqual(request.call_count, 1)
+
+    def testExpiredEntryRevalidatesWithEtag(self):
+        """Test that an expired entry is revalidated with If-None-Match and reused on 304."""
+        self.cache.set("owner/repo", {"message": "Repository exists", "etag": '"abc"'})
+        self.cache.getEntry("owner/repo")["cachedAt"] = "2000-01-01T00:00:00"
+
+        with patch.object(validateRepositories, "_githubRequest", return_value=(304, None)) as request:
+            self.assertEqual(checkGitHubRepository("owner/repo"), (True, "Repository exists"))
+
+        request.assert_called_once_with("/repos/owner/repo", '"abc"')
+        self.assertTrue(self.cache.isFresh(self.cache.getEntry("owner/repo")))
+
+    def testConditionalRequestAuthenticated(self):
+        """Test that revalidation sends the ETag, and the GITHUB_TOKEN when set."""
+        response = (304, {"ETag": '"abc"'}, b"")
+        with patch.dict(os.environ, {"GITHUB_TOKEN": "token"}), \
+             patch.object(validateRepositories, "_sendGitHubRequest", return_value=response) as send:
+            self.assertEqual(_githubRequest("/repos/owner/repo", '"abc"'), (304, '"abc"'))
+        headers = send.call_args.args[2]
+        self.assertEqual(headers["If-None-Match"], '"abc"')
+        self.assertEqual(headers["Authorization"], "bearer token")
+
+        with patch.dict(os.environ, {}, clear=True), \
+             patch.object(validateRepositories, "_sendGitHubRequest", return_value=response) as send:
+            _githubRequest("/repos/owner/repo")
+        self.assertNotIn("Authorization", send.call_args.args[2])
+
+    def testRateLimitSkipsRequests(self):
+        """Test that no requests are sent once the API reports its quota used up."""
+        with patch.object(validateRepositories, "_rateLimitResetAt", time.time() + 60), \
+             patch.object(validateRepositories, "_githubRequest") as request:
+            exists, message = checkGitHubRepository("owner/repo")
+
+        self.assertIsNone(exists)
+        self.assertIn("rate limit", message)
+        request.assert_not_called()
+
+    def testOnlyRestResponsesRecordRateLimit(self):
+        """Test that a used-up GraphQL quota does not stop REST checks, but a used-up REST quota does."""
+        resetAt = str(int(time.time()) + 60)
+        drained = {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": resetAt}
+
+        with patch.object(validateRepositories, "_rateLimitResetAt", 0.0):
+            with patch.dict(os.environ, {"GITHUB_TOKEN": "token"}), \
+                 patch.object(validateRepositories, "_sendGitHubRequest", return_value=(200, drained, b'{"data": {}}')):
+                checkGitHubRepositories(["owner/repo"])
+            self.assertEqual(validateRepositories._rateLimitResetAt, 0.0)
+
+            with patch.object(validateRepositories, "_sendGitHubRequest", return_value=(200, drained, b"")):
+                _githubRequest("/repos/owner/repo")
+            self.assertEqual(validateRepositories._rateLimitResetAt, float(resetAt))
+
+    def testBatchNeedsToken(self):
+        """Test that bulk GraphQL checks are skipped without a GITHUB_TOKEN."""
+        with patch.dict(os.environ, {}, clear=True), \
+             patch.object(validateRepositories, "_queryGitHubGraphQl") as query:
+            self.assertEqual(checkGitHubRepositories(["owner/repo"]), {})
+        query.assert_not_called()
+
+    def testBatchQuery(self):
+        """Test that repositories are checked in one GraphQL query and found ones are cached."""
+        self.cache.set("owner/cached", {"message": "Repository exists", "etag": None})
+        data = {"r0": {"nameWithOwner": "owner/repo"}, "r1": None}
+
+        with patch.dict(os.environ, {"GITHUB_TOKEN": "token"}), \
+             patch.object(validateRepositories, "_queryGitHubGraphQl", return_value=data) as query:
+            results = checkGitHubRepositories(["owner/cached", "owner/repo", "owner/missing"])
+
+        query.assert_called_once()
+        self.assertNotIn("cached", query.call_args[0][0])
+        self.assertTrue(results["owner/cached"][0])
+        self.assertTrue(results["owner/repo"][0])
+        self.assertIsNone(results["owner/missing"][0])
+        self.assertIsNotNone(self.cache.get("owner/repo"))
+
+    def testNotFoundIsNotCached(self):
+        """Test that inconclusive answers are not cached."""
+        with patch.object(validateRepositories, "_githubRequest", return_value=(404, None)):
+            self.assertIsNone(checkGitHubRepository("owner/missing")[0])
+        self.assertIsNone(self.cache.getEntry("owner/missing"))
+
+
+class TestCheckGitRepository(unittest.TestCase):
+    """Test the git ls-remote fallback."""
+
+    def testPromptsDisabled(self):
+        """Test that git ls-remote runs without stdin or credential prompts."""
+        completed = subprocess.CompletedProcess([], 0)
+        with patch.object(validateRepositories.subprocess, "run", return_value=completed) as run:
+            self.assertTrue(checkGitRepository("https://example.com/repo.git"))
+
+        kwargs = run.call_args.kwargs
+        self.assertEqual(kwargs["stdin"], subprocess.DEVNULL)
+        self.assertEqual(kwargs["env"]["GIT_TERMINAL_PROMPT"], "0")
+        self.assertEqual(kwargs["env"]["GIT_ASKPASS"], "")
+
+    def testFailureIsFalse(self):
+        """Test that a non-zero exit or a timeout means the repository is not accessible."""
+        with patch.object(validateRepositories.subprocess, "run", return_value=subprocess.CompletedProcess([], 128)):
+            self.assertFalse(checkGitRepository("https://example.com/repo.git"))
+        with patch.object(validateRepositories.subprocess, "run", side_effect=subprocess.TimeoutExpired("git", 10)):
+            self.assertFalse(checkGitRepository("https://example.com/repo.git"))
+
+
+class TestProbeSmartHttp(unittest.TestCase):
+    """Test the smart HTTP check for non-GitHub repositories."""
+
+    def testMisbehavingServer(self):
+        """Test that a malformed or truncated reply fails the repository instead of raising."""
+        for error in (http.client.IncompleteRead(b"partial"), http.client.BadStatusLine("garbage"), http.client.RemoteDisconnected()):
+            with patch("urllib.request.urlopen", side_effect=error):
+                self.assertFalse(probeSmartHttp("https://example.com/repo.git"), type(error).__name__)
+
+
+class TestClassifyRepoUrl(unittest.TestCase):
+    """Test repository URL classification."""
+
+    def testGitHub(self):
+        """Test that GitHub SSH and HTTPS URLs give their owner/repo."""
+        self.assertEqual(classifyRepoUrl("git@github.com:owner/repo.git"), ("github", "owner/repo"))
+        self.assertEqual(classifyRepoUrl("https://github.com/owner/repo/"), ("github", "owner/repo"))
+
+    def testGitHubRepoNameContainingDotGit(self):
+        """Test that only a trailing .git is dropped from the repository name."""
+        self.assertEqual(classifyRepoUrl("https://github.com/owner/owner.github.io.git"), ("github", "owner/owner.github.io"))
+
+    def testOtherHosts(self):
+        """Test that other hosts are classified by protocol."""
+        self.assertEqual(classifyRepoUrl("git@gitlab.com:owner/repo.git"), ("ssh", None))
+        self.assertEqual(classifyRepoUrl("http://github.com/owner/repo"), ("http", None))
+        self.assertEqual(classifyRepoUrl("https://gitlab.com/owner/repo.git"), ("http", None))
+        self.assertEqual(classifyRepoUrl("git://example.com/repo.git"), ("git", None))
+
+    def testInvalid(self):
+        """Test that URLs without a known scheme or a path are invalid."""
+        for url in ("owner/repo", "git@github.com", "https://example.com"):
+            self.assertEqual(classifyRepoUrl(url), ("invalid", None), url)
+
+
+class TestCheckRepository(unittest.TestCase):
+    """Test per-URL checks with network checks stubbed."""
+
+    def setUp(self):
+        """Stub out the GitHub API, smart HTTP probe, and git ls-remote."""
+        githubPatcher = patch.object(validateRepositories, "checkGitHubRepository", return_value=(True, "Repository exists"))
+        probePatcher = patch.object(validateRepositories, "probeSmartHttp", return_value=False)
+        gitPatcher = patch.object(validateRepositories, "checkGitRepository", return_value=False)
+        self.checkGitHub = githubPatcher.start()
+        self.probeSmartHttp = probePatcher.start()
+        self.checkGit = gitPatcher.start()
+        self.addCleanup(githubPatcher.stop)
+        self.addCleanup(probePatcher.stop)
+        self.addCleanup(gitPatcher.stop)
+
+    def check(self, repoUrl: str, githubResults: dict = None) -> tuple:
+        """Classify and check a URL, as the validator does."""
+        return checkRepository(repoUrl, *classifyRepoUrl(repoUrl), githubResults)
+
+    def testGitHubSshUsesApi(self):
+        """Test that GitHub SSH URLs are checked through the API."""
+        self.assertEqual(self.check("git@github.com:owner/repo.git"), ("success", "Repository exists"))
+        self.checkGitHub.assert_called_once_with("owner/repo")
+
+    def testGitHubHttpsUsesApi(self):
+        """Test that GitHub HTTPS URLs are checked through the API."""
+        self.check("https://github.com/owner/repo.git")
+        self.checkGitHub.assert_called_once_with("owner/repo")
+
+    def testGitHubUsesBatchResult(self):
+        """Test that a result from the bulk check is used instead of another API call."""
+        status, _ = self.check("git@github.com:owner/repo.git", {"owner/repo": (True, "Repository exists")})
+        self.assertEqual(status, "success")
+        self.checkGitHub.assert_not_called()
+
+    def testGitHubUnknownIsWarning(self):
+        """Test that an inconclusive API check is a warning rather than an error."""
+        self.checkGitHub.return_value = (None, "Repository not found or is private (404)")
+        status, _ = self.check("https://github.com/owner/repo")
+        self.assertEqual(status, "warning")
+
+    def testOtherSshIsWarning(self):
+        """Test that non-GitHub SSH URLs are not checked."""
+        self.assertEqual(self.check("git@gitlab.com:owner/repo.git")[0], "warning")
+        self.checkGit.assert_not_called()
+
+    def testOtherHttpsUsesSmartHttp(self):
+        """Test that other HTTPS URLs found by the smart HTTP probe skip git ls-remote."""
+        self.probeSmartHttp.return_value = True
+        self.assertEqual(self.check("https://gitlab.com/owner/repo.git")[0], "success")
+        self.checkGit.assert_not_called()
+
+    def testOtherHttpsFallsBackToLsRemote(self):
+        """Test that other HTTPS URLs fall back to git ls-remote when the probe fails."""
+        self.assertEqual(self.check("https://gitlab.com/owner/repo.git")[0], "error")
+        self.checkGit.assert_called_once_with("https://gitlab.com/owner/repo.git")
+
+    def testGitProtocolUsesLsRemote(self):
+        """Test that git:// URLs go straight to git ls-remote."""
+        self.check("git://example.com/repo.git")
+        self.probeSmartHttp.assert_not_called()
+        self.checkGit.assert_called_once_with("git://example.com/repo.git")
+
+    def testInvalidFormat(self):
+        """Test that URLs without a known scheme are errors."""
+        self.assertEqual(self.check("owner/repo"), ("error", "Invalid repository URL format"))
+
+
+class TestValidateRepositories(unittest.TestCase):
+    """Test validation of whole configs."""
+
+    def validateConfig(self, config: dict) -> int:
+        """Write a config to a temporary file and validate it."""
+        with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False, encoding="utf-8") as f:
+            json.dump(config, f)
+        try:
+            with patch.object(validateRepositories, "checkGitHubRepositories", return_value={}), \
+                 patch.object(validateRepositories, "checkGitHubRepository", return_value=(True, "Repository exists")):
+                return validateRepositories.validateRepositories(f.name)
+        finally:
+            Path(f.name).unlink()
+
+    def testValidConfig(self):
+        """Test that valid paths, URLs, and wildcard patterns pass."""
+        exitCode = self.validateConfig({
+            "workPathUnix": "~/work",
+            "workPathWindows": "C:\\work",
+            "repositories": [
+                "git@github.com:owner/repo.git",
+                {"pattern": "https://github.com/owner/*", "visibility": "public"},
+            ],
+        })
+        self.assertEqual(exitCode, 0)
+
+    def testInvalidEntriesFail(self):
+        """Test that bad URLs, visibilities, and wildcard patterns are counted as errors."""
+        exitCode = self.validateConfig({
+            "workPathUnix": "~/work",
+            "repositories": [
+                "owner/repo",
+                {"pattern": "git@github.com:owner/*", "visibility": "secret"},
+                {"pattern": "git@github.com:*/*"},
+            ],
+        })
+        self.assertEqual(exitCode, 1)
+
+    def testDuplicatesCheckedOnce(self):
+        """Test that the same repository listed in several forms is only checked once."""
+        with patch.object(validateRepositories, "checkRepository", return_value=("success", "Repository exists")) as check:
+            exitCode = self.validateConfig({
+                "workPathUnix": "~/work",
+                "repositories": [
+                    "git@github.com:owner/repo.git",
+                    "https://github.com/owner/other",
+                    "https://github.com/owner/repo",
+                ],
+            })
+
+        self.assertEqual(exitCode, 0)
+        self.assertEqual(check.call_count, 2)
+
+    def testRepositoriesNotAList(self):
+        """Test that a repositories value that is not an array fails."""
+        self.assertEqual(self.validateConfig({"workPathUnix": "~/work", "repositories": "git@github.com:owner/repo.git"}), 1)
+
+    def testMissingWorkPaths(self):
+        """Test that a config without any work path fails."""
+        self.assertEqual(self.validateConfig({"repositories": ["git@github.com:owner/repo.git"]}), 1)
+
+
+def main():
+    """Run all tests."""
+    # Run tests with verbose output
+    loader = unittest.TestLoader()
+    suite = loader.loadTestsFromModule(sys.modules[__name__])
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+
+    # Return exit code based on results
+    return 0 if result.wasSuccessful() else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
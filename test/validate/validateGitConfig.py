@@ -8,11 +8,10 @@ import json
 import re
 import sys
 import time
-import urllib.error
-import urllib.request
-from email.utils import parseaddr
+from datetime import timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Dict, Optional
 
 # Add project root to path so we can import from common
 scriptDir = Path(__file__).parent.absolute()
@@ -26,8 +25,19 @@ from common.common import (
     printSuccess,
     printWarning,
     safePrint,
+    TtlCache,
 )
 
+# Patterns applied per value are compiled once at import rather than on every call
+_EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_GITHUB_USERNAME_PATTERN = re.compile(r'^[a-zA-Z0-9]([a-zA-Z0-9-]{0,37}[a-zA-Z0-9])?$')
+_BRANCH_NAME_PATTERN = re.compile(r'^[a-zA-Z0-9._/-]+$')
+# Python's re has no \p{L}/\p{N}; [^\W_] is the Unicode "letter or digit" equivalent
+_WEB_FORM_PATTERN = re.compile(r"^(?:[^\W_]|[\s\-'.])+$")
+
+# GitHub usernames rarely change, so definitive API answers are reused across runs for a day
+_httpCache = TtlCache('http_cache.json', timedelta(hours=24))
+
 
 def isValidUtf8(text: str) -> bool:
     """Check if text is valid UTF-8"""
@@ -43,13 +53,8 @@ def isWebFormCompatible(text: str) -> bool:
     Allows letters, numbers, spaces, hyphens, apostrophes, and common Unicode characters
     """
     # GitHub allows most Unicode characters in names, but we'll be conservative
-    # Allow letters, numbers, spaces, hyphens, apostrophes, and common punctuation
-    pattern = r'^[\p{L}\p{N}\s\-\'\.]+$'
-    try:
-        return bool(re.match(pattern, text, re.UNICODE))
-    except Exception:
-        # Fallback: check for control characters and problematic characters
-        return not any(ord(c) < 32 or c in '<>{}[]|\\`' for c in text)
+    # Allow letters, numbers, spaces, hyphens, apostrophes, and periods
+    return bool(_WEB_FORM_PATTERN.match(text))
 
 
 def isValidEmail(email: str) -> bool:
@@ -57,26 +62,15 @@ def isValidEmail(email: str) -> bool:
     if not email:
         return False
 
-    # Basic email validation
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    if not re.match(pattern, email):
-        return False
-
-    # Use email.utils.parseaddr for additional validation
-    name, addr = parseaddr(email)
-    return bool(addr and '@' in addr)
+    # The pattern guarantees a single local part, '@', and a dotted domain
+    return bool(_EMAIL_PATTERN.match(email))
 
 
-def githubUsernameExists(username: str) -> tuple[Optional[bool], str]:
-    """Check if GitHub username exists"""
+def queryGithubUsername(username: str) -> tuple[Optional[bool], str]:
+    """Query the GitHub API for a username, without any caching"""
     import os
-
-    if not username:
-        return False, "Username is empty"
-
-    # GitHub username validation: alphanumeric and hyphens, 1-39 chars
-    if not re.match(r'^[a-zA-Z0-9]([a-zA-Z0-9-]{0,37}[a-zA-Z0-9])?$', username):
-        return False, "Invalid GitHub username format"
+    import urllib.error
+    import urllib.request
 
     isCi = os.getenv('CI') == 'true' or os.getenv('GITHUB_ACTIONS') == 'true'
 
@@ -112,6 +106,31 @@ def githubUsernameExists(username: str) -> tuple[Optional[bool], str]:
         return None, f"Error checking GitHub: {str(e)}"
 
 
+@lru_cache(maxsize=256)
+def githubUsernameExists(username: str) -> tuple[Optional[bool], str]:
+    """Check if GitHub username exists (memoised in-process and cached on disk for 24h)"""
+    if not username:
+        return False, "Username is empty"
+
+    # GitHub username validation: alphanumeric and hyphens, 1-39 chars
+    if not _GITHUB_USERNAME_PATTERN.match(username):
+        return False, "Invalid GitHub username format"
+
+    cacheKey = f"https://api.github.com/users/{username}"
+    cached = _httpCache.get(cacheKey)
+    if cached:
+        return cached['exists'], cached['message']
+
+    exists, message = queryGithubUsername(username)
+
+    # Only definitive answers are cached; network failures should be retried next run
+    if exists is not None:
+        _httpCache.set(cacheKey, {'exists': exists, 'message': message})
+        _httpCache.save()
+
+    return exists, message
+
+
 def validateGitAlias(alias: str) -> tuple[bool, str]:
     """Validate a git alias command"""
     if not alias:
@@ -125,6 +144,46 @@ def validateGitAlias(alias: str) -> tuple[bool, str]:
     return True, "Valid"
 
 
+def _oneOf(description: str, *allowed: Any) -> Callable[[Any], Optional[str]]:
+    """Build a defaults validator accepting only the given values."""
+    allowedValues = frozenset(allowed)
+
+    def validator(value: Any) -> Optional[str]:
+        if value in allowedValues:
+            return None
+        return f"Invalid value '{value}' (should be {description})"
+
+    return validator
+
+
+def _validateNonNegativeInt(value: Any) -> Optional[str]:
+    """Defaults validator for non-negative integers (as int or string, since JSON allows both)."""
+    try:
+        intValue = int(value) if isinstance(value, str) else value
+        if isinstance(intValue, int) and intValue >= 0:
+            return None
+    except (ValueError, TypeError):
+        pass
+    return f"Invalid value '{value}' (should be a non-negative integer)"
+
+
+def _acceptAnyValue(value: Any) -> Optional[str]:
+    """Defaults validator for keys without specific rules."""
+    return None
+
+
+# Per-key validators for the defaults section; each returns an error message or None
+_DEFAULT_VALIDATORS: Dict[str, Callable[[Any], Optional[str]]] = {
+    'color.ui': _oneOf("auto, always, never, true, or false", 'auto', 'always', 'never', 'true', 'false'),
+    'pull.rebase': _oneOf("true or false", 'true', 'false', True, False),
+    'push.default': _oneOf("nothing, matching, upstream, simple, or current", 'nothing', 'matching', 'upstream', 'simple', 'current'),
+    'push.autoSetupRemote': _oneOf("true or false", 'true', 'false', True, False),
+    'rebase.autoStash': _oneOf("true or false", 'true', 'false', True, False),
+    'merge.ff': _oneOf("true, false, or only", 'true', 'false', 'only', True, False),
+    'fetch.parallel': _validateNonNegativeInt,
+}
+
+
 def validateGitConfig(configPath: str) -> int:
     """Main validation function"""
     errors = []
@@ -211,7 +270,7 @@ def validateGitConfig(configPath: str) -> int:
         if 'init.defaultBranch' in defaults:
             defaultBranch = defaults['init.defaultBranch']
             # Basic validation: should be a valid branch name
-            if re.match(r'^[a-zA-Z0-9._/-]+$', defaultBranch):
+            if _BRANCH_NAME_PATTERN.match(defaultBranch):
                 printSuccess(f"init.defaultBranch: {defaultBranch}")
             else:
                 errors.append(f"init.defaultBranch: Invalid branch name: {defaultBranch}")
@@ -223,29 +282,9 @@ def validateGitConfig(configPath: str) -> int:
 
             # Basic validation: value should be a string or number
             if isinstance(value, (str, int, bool)):
-                # Additional validation for specific keys
-                if key == 'color.ui' and value not in ['auto', 'always', 'never', 'true', 'false']:
-                    errors.append(f"defaults.{key}: Invalid value '{value}' (should be auto, always, never, true, or false)")
-                elif key == 'pull.rebase' and value not in ['true', 'false', True, False]:
-                    errors.append(f"defaults.{key}: Invalid value '{value}' (should be true or false)")
-                elif key == 'push.default' and value not in ['nothing', 'matching', 'upstream', 'simple', 'current']:
-                    errors.append(f"defaults.{key}: Invalid value '{value}' (should be nothing, matching, upstream, simple, or current)")
-                elif key == 'push.autoSetupRemote' and value not in ['true', 'false', True, False]:
-                    errors.append(f"defaults.{key}: Invalid value '{value}' (should be true or false)")
-                elif key == 'rebase.autoStash' and value not in ['true', 'false', True, False]:
-                    errors.append(f"defaults.{key}: Invalid value '{value}' (should be true or false)")
-                elif key == 'merge.ff' and value not in ['true', 'false', 'only', True, False]:
-                    errors.append(f"defaults.{key}: Invalid value '{value}' (should be true, false, or only)")
-                elif key == 'fetch.parallel':
-                    # Handle both string and int values from JSON
-                    try:
-                        intValue = int(value) if isinstance(value, str) else value
-                        if not isinstance(intValue, int) or intValue < 0:
-                            errors.append(f"defaults.{key}: Invalid value '{value}' (should be a non-negative integer)")
-                        else:
-                            printSuccess(f"defaults.{key}: {value}")
-                    except (ValueError, TypeError):
-                        errors.append(f"defaults.{key}: Invalid value '{value}' (should be a non-negative integer)")
+                error = _DEFAULT_VALIDATORS.get(key, _acceptAnyValue)(value)
+                if error:
+                    errors.append(f"defaults.{key}: {error}")
                 else:
                     printSuccess(f"defaults.{key}: {value}")
             else:
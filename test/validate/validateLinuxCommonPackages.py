@@ -6,16 +6,21 @@ Each package manager section (apt, dnf, pacman, zypper) is validated independent
 Uses thread pool for parallel API calls (much faster than sequential).
 """
 
+import importlib.util
 import json
 import re
 import sys
+import threading
 import time
+import zlib
 from abc import ABC, abstractmethod
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from datetime import timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-from urllib.request import urlopen, Request
-from urllib.error import URLError, HTTPError
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import quote, urljoin, urlsplit
 
 # Add project root to path
 scriptDir = Path(__file__).parent.absolute()
@@ -31,48 +36,461 @@ from common.common import (
     printSuccess,
     printWarning,
     safePrint,
+    TtlCache,
 )
 
+# orjson parses response bytes several times faster; its errors are ValueErrors like json's
+try:
+    from orjson import loads as _jsonLoads
+except ImportError:
+    from json import loads as _jsonLoads
+
+
+# Search result pages can be hundreds of KB; anything we look for appears well before this
+_MAX_RESPONSE_BYTES = 256 * 1024
+_READ_CHUNK_BYTES = 8192
+# Bytes carried between chunks so a needle split across a chunk boundary still matches
+_MATCH_OVERLAP_BYTES = 512
+
+
+def _readResponse(
+    chunks: Iterable[bytes],
+    contentEncoding: str,
+    stopAt: Optional[re.Pattern] = None,
+    maxBytes: int = _MAX_RESPONSE_BYTES,
+) -> bytes:
+    """
+    Read a response body incrementally from its raw chunks, without decoding it.
+    Transparently gunzips, caps the body at maxBytes, and stops as soon as stopAt matches.
+    """
+    decompressor = None
+    if contentEncoding.lower() == 'gzip':
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+
+    body = bytearray()
+    for chunk in chunks:
+        if decompressor:
+            chunk = decompressor.decompress(chunk)
+        searchFrom = max(0, len(body) - _MATCH_OVERLAP_BYTES)
+        body += chunk
+
+        if stopAt is not None and stopAt.search(body, searchFrom):
+            break
+
+        if len(body) >= maxBytes:
+            break
+
+    return bytes(body)
+
+
+# Keep-alive connections, one per (scheme, host) for each worker thread, so every
+# package checked against the same host after the first skips the TCP and TLS handshake
+_connections = threading.local()
+_REQUEST_HEADERS = {'User-Agent': 'Mozilla/5.0', 'Accept-Encoding': 'gzip'}
+_REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+_MAX_REDIRECTS = 5
+# Statuses that definitively mean "no such package", as opposed to a transient failure
+_NOT_FOUND_STATUSES = (404, 410)
+
+# Cap on simultaneous requests to any one host, however large the thread pool is,
+# so a big --pool-size spreads across hosts instead of hammering a single one
+MAX_REQUESTS_PER_HOST = 8
+_hostSlots: Dict[str, threading.BoundedSemaphore] = {}
+_hostSlotsLock = threading.Lock()
+
+
+def _hostSlot(host: str) -> threading.BoundedSemaphore:
+    """Get the semaphore limiting concurrent requests to a host."""
+    with _hostSlotsLock:
+        slot = _hostSlots.get(host)
+        if slot is None:
+            slot = _hostSlots[host] = threading.BoundedSemaphore(MAX_REQUESTS_PER_HOST)
+        return slot
+
+
+def _cacheDnsLookups() -> None:
+    """
+    Memoise DNS lookups for the rest of the run.
+    Every check goes to the same handful of repository hosts, so each is resolved once
+    rather than on every new connection. Failed lookups are not cached.
+    """
+    import socket
+
+    if not hasattr(socket.getaddrinfo, 'cache_info'):
+        socket.getaddrinfo = lru_cache(maxsize=256)(socket.getaddrinfo)
+
+
+@lru_cache(maxsize=1)
+def _getSslContext():
+    """Get the TLS context shared by every HTTPS connection, so system CAs are loaded once."""
+    import ssl
+
+    return ssl.create_default_context()
+
+
+def _getConnection(scheme: str, host: str, timeout: int):
+    """Get this thread's connection to a host, creating it if needed."""
+    import http.client
+
+    pool = getattr(_connections, 'pool', None)
+    if pool is None:
+        pool = _connections.pool = {}
+
+    connection = pool.get((scheme, host))
+    if connection is None:
+        if scheme == 'https':
+            connection = http.client.HTTPSConnection(host, timeout=timeout, context=_getSslContext())
+        else:
+            connection = http.client.HTTPConnection(host, timeout=timeout)
+        pool[(scheme, host)] = connection
+    elif connection.sock is not None:
+        connection.sock.settimeout(timeout)
+    return connection
+
+
+def _dropConnection(scheme: str, host: str) -> None:
+    """Close and forget this thread's connection to a host."""
+    connection = getattr(_connections, 'pool', {}).pop((scheme, host), None)
+    if connection is not None:
+        connection.close()
+
+
+def _sendRequest(scheme: str, host: str, path: str, timeout: int, method: str = 'GET'):
+    """Send a request over a pooled connection, reconnecting once if the server closed it while idle."""
+    import http.client
+
+    while True:
+        connection = _getConnection(scheme, host, timeout)
+        reused = connection.sock is not None
+        try:
+            connection.request(method, path, headers=_REQUEST_HEADERS)
+            return connection.getresponse()
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            _dropConnection(scheme, host)
+            if not reused:
+                raise
+
+
+@lru_cache(maxsize=1)
+def _getHttp2Client():
+    """
+    Get the shared HTTP/2 client, if httpx and h2 are installed.
+    One multiplexed connection per host then carries every concurrent check to it.
+
+    Returns:
+        httpx.Client, or None to use the keep-alive http.client pool instead
+    """
+    if importlib.util.find_spec("httpx") is None or importlib.util.find_spec("h2") is None:
+        return None
+
+    import httpx
+
+    return httpx.Client(
+        http2=True,
+        headers=_REQUEST_HEADERS,
+        follow_redirects=True,
+        max_redirects=_MAX_REDIRECTS,
+    )
+
+
+def _fetchUrlHttp2(
+    client,
+    url: str,
+    timeout: int,
+    stopAt: Optional[re.Pattern],
+    maxBytes: int,
+    method: str,
+) -> Tuple[Optional[int], Optional[bytes]]:
+    """Fetch a URL over the shared HTTP/2 client; same contract as _fetchUrl."""
+    import httpx
+
+    try:
+        with _hostSlot(urlsplit(url).netloc):
+            # Leaving the stream early (stopAt, maxBytes) only resets that stream, not the connection
+            with client.stream(method, url, timeout=timeout) as response:
+                body = None
+                if response.is_success:
+                    chunks = response.iter_raw(_READ_CHUNK_BYTES)
+                    body = _readResponse(chunks, response.headers.get('Content-Encoding', ''), stopAt, maxBytes)
+                return response.status_code, body
+    except (httpx.HTTPError, httpx.StreamError, zlib.error):
+        return None, None
+
+
+# Responses already fetched this run, so a URL requested again is not refetched.
+# Kept small, and only definite answers (2xx or not found) of at most
+# _MAX_RESPONSE_BYTES are held, so failures are retried and large indices are not kept
+_FETCH_CACHE_SIZE = 64
+_fetchCache: "OrderedDict[tuple, Tuple[int, Optional[bytes]]]" = OrderedDict()
+_fetchCacheLock = threading.Lock()
+
+
+def _fetchUrl(
+    url: str,
+    timeout: int = 10,
+    stopAt: Optional[re.Pattern] = None,
+    maxBytes: int = _MAX_RESPONSE_BYTES,
+    method: str = 'GET',
+) -> Tuple[Optional[int], Optional[bytes]]:
+    """
+    Fetch raw URL content with error handling, reusing recent definite answers.
+    With method='HEAD' only the status is fetched and a successful body is empty.
+
+    Returns:
+        Tuple of (status, body); status is None on a network error, body is None unless the status was 2xx
+    """
+    key = (url, stopAt, maxBytes, method)
+    with _fetchCacheLock:
+        cached = _fetchCache.get(key)
+        if cached is not None:
+            _fetchCache.move_to_end(key)
+            return cached
+
+    status, body = _fetchUrlUncached(url, timeout, stopAt, maxBytes, method)
+
+    definite = status is not None and (200 <= status < 300 or status in _NOT_FOUND_STATUSES)
+    if definite and (body is None or len(body) <= _MAX_RESPONSE_BYTES):
+        with _fetchCacheLock:
+            _fetchCache[key] = (status, body)
+            _fetchCache.move_to_end(key)
+            while len(_fetchCache) > _FETCH_CACHE_SIZE:
+                _fetchCache.popitem(last=False)
+    return status, body
+
+
+def _fetchUrlUncached(
+    url: str,
+    timeout: int,
+    stopAt: Optional[re.Pattern],
+    maxBytes: int,
+    method: str,
+) -> Tuple[Optional[int], Optional[bytes]]:
+    """Fetch a URL over HTTP/2 if available, or else over this thread's keep-alive connections."""
+    http2Client = _getHttp2Client()
+    if http2Client is not None:
+        return _fetchUrlHttp2(http2Client, url, timeout, stopAt, maxBytes, method)
+
+    # Deferred: http.client pulls in ssl and email, and is only needed once the
+    # first uncached package is actually checked
+    import http.client
+
+    scheme = host = None
+    try:
+        for _ in range(_MAX_REDIRECTS + 1):
+            parts = urlsplit(url)
+            scheme, host = parts.scheme, parts.netloc
+            path = (parts.path or '/') + (f"?{parts.query}" if parts.query else '')
+
+            with _hostSlot(host):
+                response = _sendRequest(scheme, host, path, timeout, method)
+                location = response.getheader('Location')
+                if response.status in _REDIRECT_STATUSES and location:
+                    response.read()
+                    url = urljoin(url, location)
+                    continue
+
+                if 200 <= response.status < 300:
+                    chunks = iter(lambda: response.read(_READ_CHUNK_BYTES), b'')
+                    body = _readResponse(chunks, response.getheader('Content-Encoding', ''), stopAt, maxBytes)
+                else:
+                    body = None
+                    response.read(_MAX_RESPONSE_BYTES)
+
+                # A connection can only be reused once its response has been read to the end
+                if not response.isclosed():
+                    _dropConnection(scheme, host)
+            return response.status, body
+
+        return None, None
+    except (http.client.HTTPException, OSError, zlib.error):
+        if host is not None:
+            _dropConnection(scheme, host)
+        return None, None
+
+
+@lru_cache(maxsize=4096)
+def _packageMatcher(package: str) -> re.Pattern:
+    """
+    Build a case-insensitive bytes matcher for a package name in a search results page.
+    Only result markup is matched: the "<h3>Package name</h3>" heading of the Debian and
+    Ubuntu searches, or a "/package/name" link on software.opensuse.org. The search term
+    echoed back in the page (e.g. "<em>name</em>") is never a hit.
+    Both needles are folded into one alternation, so a raw page is scanned once
+    (stopping at the first hit) without decoding it or allocating a lowercased copy.
+    """
+    name = re.escape(package.encode('utf-8'))
+    return re.compile(
+        rb"<h3>\s*package\s+" + name + rb"\s*</h3>|/package/" + name + rb"(?![\w.+-])",
+        re.IGNORECASE,
+    )
+
 
 class PackageManagerChecker(ABC):
     """Abstract base class for package manager checkers."""
 
+    # Packages per checkPackages call for bulk-capable checkers; each chunk is a separate task
+    BULK_CHUNK_SIZE = 50
+
     def __init__(self, name: str):
         self.name = name
+        # Set by the validator to remember definite "not found" responses between runs
+        self.responseCache: Optional[TtlCache] = None
 
     @abstractmethod
     def checkPackage(self, package: str) -> bool:
         """Check if package exists in this package manager's repositories."""
         pass
 
-    def fetchUrl(self, url: str, timeout: int = 10) -> Optional[str]:
-        """Fetch URL content with error handling."""
-        try:
-            request = Request(url, headers={'User-Agent': 'Mozilla/5.0'})
-            with urlopen(request, timeout=timeout) as response:
-                return response.read().decode('utf-8', errors='ignore')
-        except (URLError, HTTPError, TimeoutError):
-            return None
+    def supportsBulk(self) -> bool:
+        """Check if this checker can answer many packages per request via checkPackages."""
+        return False
+
+    def checkPackages(self, packages: List[str]) -> Dict[str, bool]:
+        """
+        Check many packages at once.
+        The default checks them one at a time; bulk-capable checkers override this.
+
+        Returns:
+            Dictionary mapping each package name to whether it was found
+        """
+        return {package: self.checkPackage(package) for package in packages}
+
+    def close(self) -> None:
+        """Release anything the checker holds on to between checks."""
+        pass
+
+    def fetchUrl(
+        self,
+        url: str,
+        timeout: int = 10,
+        stopAt: Optional[re.Pattern] = None,
+        maxBytes: int = _MAX_RESPONSE_BYTES,
+    ) -> Optional[bytes]:
+        """
+        Fetch raw URL content with error handling (shared cache across checkers).
+
+        Args:
+            url: URL to fetch
+            timeout: Request timeout in seconds
+            stopAt: Optional bytes pattern; reading stops as soon as it has been seen
+            maxBytes: Maximum number of (decompressed) body bytes to read
+
+        Returns:
+            Undecoded response body, or None on error
+        """
+        return self.requestUrl(url, timeout, stopAt, maxBytes)[1]
+
+    def requestUrl(
+        self,
+        url: str,
+        timeout: int = 10,
+        stopAt: Optional[re.Pattern] = None,
+        maxBytes: int = _MAX_RESPONSE_BYTES,
+        method: str = 'GET',
+    ) -> Tuple[Optional[int], Optional[bytes]]:
+        """
+        Request a URL, answering from and recording definite not-found responses in the response cache.
+
+        Returns:
+            Tuple of (status, body) as returned by _fetchUrl
+        """
+        if self.responseCache is not None:
+            cachedStatus = self.responseCache.get(url)
+            if cachedStatus is not None:
+                return cachedStatus, None
+
+        status, body = _fetchUrl(url, timeout, stopAt, maxBytes, method)
+        if status in _NOT_FOUND_STATUSES and self.responseCache is not None:
+            self.responseCache.set(url, status)
+        return status, body
 
 
 class AptChecker(PackageManagerChecker):
     """Checks packages in APT repositories (Debian/Ubuntu)."""
 
+    # Gzipped name lists for the current Ubuntu LTS and Debian stable, loaded once per run
+    INDEX_URLS = [
+        "https://packages.ubuntu.com/noble/allpackages?format=txt.gz",
+        "https://packages.debian.org/stable/allpackages?format=txt.gz",
+    ]
+    INDEX_MAX_BYTES = 16 * 1024 * 1024
+    # Each package line starts with its name followed by the version in parentheses
+    INDEX_LINE_PATTERN = re.compile(rb"^([a-z0-9][a-z0-9+.\-]*) \(", re.MULTILINE)
+    # Threads for searching every base URL at once; long-lived so their connections are reused
+    SEARCH_WORKERS = 8
+
     def __init__(self):
         super().__init__("apt")
         self.baseUrls = [
             "https://packages.ubuntu.com/search",
             "https://packages.debian.org/search",
         ]
+        self._index: Optional[frozenset] = None
+        self._indexLock = threading.Lock()
+        self._searchExecutor = ThreadPoolExecutor(max_workers=self.SEARCH_WORKERS, thread_name_prefix="apt-search")
+
+    def loadIndex(self) -> frozenset:
+        """
+        Get the set of package names from the suite indices, downloading them on first use.
+        Thread-safe; concurrent callers wait for the first download.
+
+        Returns:
+            Package names (empty if no index could be fetched)
+        """
+        with self._indexLock:
+            if self._index is None:
+                names = set()
+                for url in self.INDEX_URLS:
+                    indexNames = self.parseIndex(self.fetchUrl(url, timeout=30, maxBytes=self.INDEX_MAX_BYTES))
+                    if not indexNames:
+                        printWarning(f"Could not load APT package index {url}; packages will be searched for instead")
+                    names.update(indexNames)
+                self._index = frozenset(names)
+            return self._index
+
+    @classmethod
+    def parseIndex(cls, content: Optional[bytes]) -> set:
+        """
+        Get the package names from a downloaded index.
+        The body is gunzipped here unless the transport already did so (Content-Encoding: gzip).
+
+        Returns:
+            Package names (empty if the download failed or could not be read)
+        """
+        if not content:
+            return set()
+
+        if content.startswith(b"\x1f\x8b"):
+            try:
+                # A truncated download still yields every complete line before the cut
+                content = zlib.decompressobj(16 + zlib.MAX_WBITS).decompress(content)
+            except zlib.error:
+                return set()
+        return {name.decode('ascii') for name in cls.INDEX_LINE_PATTERN.findall(content)}
+
+    def close(self) -> None:
+        """Stop the search threads, abandoning any search still running."""
+        self._searchExecutor.shutdown(wait=False, cancel_futures=True)
 
     def checkPackage(self, package: str) -> bool:
         """Check if package exists in APT repositories."""
-        params = f"?keywords={package}&searchon=names&suite=all&section=all"
-
-        for baseUrl in self.baseUrls:
-            url = baseUrl + params
-            content = self.fetchUrl(url)
-            if content and package in content:
+        if package in self.loadIndex():
+            return True
+
+        # Not in the current suites (or no index); search every suite before reporting it missing.
+        # Both sites are searched at once and the first hit wins; a slower search is left to finish
+        # exact=1 limits the results page to the package itself rather than every name containing it
+        # Only a result heading counts as a hit; every page echoes the search term back
+        params = f"?keywords={quote(package)}&searchon=names&exact=1&suite=all&section=all"
+
+        matcher = _packageMatcher(package)
+
+        futures = [self._searchExecutor.submit(self.fetchUrl, baseUrl + params, stopAt=matcher) for baseUrl in self.baseUrls]
+        for future in as_completed(futures):
+            content = future.result()
+            if content and matcher.search(content):
+                for other in futures:
+                    other.cancel()
                 return True
 
         return False
@@ -81,33 +499,92 @@ class AptChecker(PackageManagerChecker):
 class DnfChecker(PackageManagerChecker):
     """Checks packages in DNF repositories (Fedora/RHEL 8+)."""
 
-    def __init__(self):
+    def __init__(self, legacy: bool = False):
+        """
+        Initialise DNF checker.
+
+        Args:
+            legacy: Scrape the packages.fedoraproject.org HTML page instead of querying mdapi
+        """
         super().__init__("dnf")
+        self.legacy = legacy
 
     def checkPackage(self, package: str) -> bool:
         """Check if package exists in DNF/Fedora repositories."""
-        # Use Fedora packages API
-        url = f"https://packages.fedoraproject.org/pkgs/{package}/"
-        content = self.fetchUrl(url)
-        return content is not None and "Package not found" not in content
+        if self.legacy:
+            url = f"https://packages.fedoraproject.org/pkgs/{package}/"
+            content = self.fetchUrl(url)
+            return content is not None and b"Package not found" not in content
+
+        # Fedora's metadata API returns a small JSON document, or 404 for unknown packages
+        url = f"https://mdapi.fedoraproject.org/rawhide/pkg/{quote(package)}"
+        return self.fetchUrl(url) is not None
 
 
 class PacmanChecker(PackageManagerChecker):
     """Checks packages in Pacman repositories (Arch Linux)."""
 
+    # Names per bulk search request (the endpoint accepts repeated name parameters)
+    BULK_CHUNK_SIZE = 50
+    # Bulk responses list every matching repo/arch entry, so allow a larger body
+    BULK_MAX_BYTES = 4 * 1024 * 1024
+
     def __init__(self):
         super().__init__("pacman")
 
+    def supportsBulk(self) -> bool:
+        return True
+
+    def checkPackages(self, packages: List[str]) -> Dict[str, bool]:
+        """Check many packages with one exact-name search request per chunk."""
+        found: Dict[str, bool] = {}
+        for start in range(0, len(packages), self.BULK_CHUNK_SIZE):
+            chunk = packages[start:start + self.BULK_CHUNK_SIZE]
+            names = self.searchNames(chunk)
+            if names is None:
+                # Bulk request failed; fall back to individual checks for this chunk
+                found.update({package: self.checkPackage(package) for package in chunk})
+            else:
+                # Missing packages are rare, so each one is confirmed on its own before being
+                # reported; this also covers a server applying only one of the name parameters
+                found.update({package: package in names or self.checkPackage(package) for package in chunk})
+        return found
+
+    def searchNames(self, packages: List[str]) -> Optional[set]:
+        """
+        Run an exact-name search for several packages, following result pages.
+
+        Returns:
+            Set of package names found, or None if any request failed
+        """
+        query = "&".join(f"name={quote(package)}" for package in packages)
+        names = set()
+        page = 1
+        numPages = 1
+        while page <= numPages:
+            url = f"https://archlinux.org/packages/search/json/?{query}&page={page}"
+            content = self.fetchUrl(url, maxBytes=self.BULK_MAX_BYTES)
+            if not content:
+                return None
+            try:
+                data = _jsonLoads(content)
+            except ValueError:
+                return None
+            names.update(result.get("pkgname") for result in data.get("results", []))
+            numPages = data.get("num_pages", 1) or 1
+            page += 1
+        return names
+
     def checkPackage(self, package: str) -> bool:
         """Check if package exists in Arch repositories."""
         # Use Arch Linux package search
-        url = f"https://archlinux.org/packages/search/json/?name={package}"
+        url = f"https://archlinux.org/packages/search/json/?name={quote(package)}"
         content = self.fetchUrl(url)
         if content:
             try:
-                data = json.loads(content)
+                data = _jsonLoads(content)
                 return len(data.get("results", [])) > 0
-            except json.JSONDecodeError:
+            except ValueError:
                 pass
         return False
 
@@ -121,9 +598,10 @@ class ZypperChecker(PackageManagerChecker):
     def checkPackage(self, package: str) -> bool:
         """Check if package exists in OpenSUSE repositories."""
         # Use OpenSUSE software search
-        url = f"https://software.opensuse.org/search?q={package}"
-        content = self.fetchUrl(url)
-        return content is not None and package in content
+        url = f"https://software.opensuse.org/search?q={quote(package)}"
+        matcher = _packageMatcher(package)
+        content = self.fetchUrl(url, stopAt=matcher)
+        return content is not None and matcher.search(content) is not None
 
 
 class SnapChecker(PackageManagerChecker):
@@ -137,11 +615,12 @@ class SnapChecker(PackageManagerChecker):
         # Use snapcraft.io API
         url = f"https://snapcraft.io/api/v2/snaps/info/{package}"
         content = self.fetchUrl(url)
-        if content:
+        # Error responses carry an error list; no need to decode them
+        if content and b'"error-list"' not in content:
             try:
-                data = json.loads(content)
+                data = _jsonLoads(content)
                 return "error-list" not in data
-            except json.JSONDecodeError:
+            except ValueError:
                 pass
         return False
 
@@ -149,83 +628,216 @@ class SnapChecker(PackageManagerChecker):
 class FlatpakChecker(PackageManagerChecker):
     """Checks packages in Flathub."""
 
+    # Enough of an appstream document to tell it from an empty or "null" reply
+    GET_MAX_BYTES = 1024
+
     def __init__(self):
         super().__init__("flatpak")
 
     def checkPackage(self, package: str) -> bool:
         """Check if package exists in Flathub."""
-        # Flathub API
+        # Flathub API; unknown app IDs are a 404 or a short reply, so only the start of the document is read.
+        # Flathub does not answer HEAD on this route (405), so a HEAD probe would only add a request
         url = f"https://flathub.org/api/v2/appstream/{package}"
-        content = self.fetchUrl(url)
+        content = self.fetchUrl(url, maxBytes=self.GET_MAX_BYTES)
         return content is not None and len(content) > 10
 
 
 class LinuxCommonValidator:
     """Validates packages for each package manager in linuxCommon.json."""
 
-    def __init__(self):
-        self.checkers: Dict[str, PackageManagerChecker] = {
-            "apt": AptChecker(),
-            "dnf": DnfChecker(),
-            "pacman": PacmanChecker(),
-            "zypper": ZypperChecker(),
-            "snap": SnapChecker(),
-            "flatpak": FlatpakChecker(),
+    # Default number of concurrent package checks
+    DEFAULT_POOL_SIZE = 16
+
+    # Packages rarely disappear from upstream repositories, so positive results are reused for a week
+    CACHE_TTL = timedelta(days=7)
+    # Not-found responses are only trusted for a day, so newly published packages show up quickly
+    RESPONSE_CACHE_TTL = timedelta(hours=24)
+
+    def __init__(self, legacy: bool = False, poolSize: int = DEFAULT_POOL_SIZE, useCache: bool = True):
+        """
+        Initialise validator.
+
+        Args:
+            legacy: Use the legacy HTML scraping checks where an API-based check exists
+            poolSize: Number of concurrent package checks (threads)
+            useCache: Reuse package-found results and not-found responses from previous runs
+        """
+        self.poolSize = max(1, poolSize)
+        self.cache = TtlCache("pkgcheck.json", self.CACHE_TTL, enabled=useCache)
+        self.responseCache = TtlCache("pkgcheck_responses.json", self.RESPONSE_CACHE_TTL, enabled=useCache)
+        # Checkers are only built for the package managers actually validated
+        self.checkerFactories: Dict[str, Callable[[], PackageManagerChecker]] = {
+            "apt": AptChecker,
+            "dnf": lambda: DnfChecker(legacy=legacy),
+            "pacman": PacmanChecker,
+            "zypper": ZypperChecker,
+            "snap": SnapChecker,
+            "flatpak": FlatpakChecker,
         }
+        self.checkers: Dict[str, PackageManagerChecker] = {}
         self.results: Dict[str, List[Tuple[str, bool]]] = {}
 
-    def validatePackageManager(self, pm: str, packages: List[str], maxWorkers: int = 10) -> List[Tuple[str, bool]]:
+    def hasChecker(self, pm: str) -> bool:
+        """Check if a checker is implemented for a package manager."""
+        return pm in self.checkerFactories
+
+    def getChecker(self, pm: str) -> PackageManagerChecker:
+        """Get the checker for a package manager, creating it on first use."""
+        checker = self.checkers.get(pm)
+        if checker is None:
+            checker = self.checkers[pm] = self.checkerFactories[pm]()
+            checker.responseCache = self.responseCache
+        return checker
+
+    def close(self) -> None:
+        """Release the resources held by every checker created so far."""
+        for checker in self.checkers.values():
+            checker.close()
+
+    def saveCaches(self) -> None:
+        """Persist cached results for the next run."""
+        self.cache.save()
+        self.responseCache.save()
+
+    def submitChecks(self, executor: ThreadPoolExecutor, pm: str, packages: List[str]) -> Dict[Future, List[int]]:
+        """
+        Submit package checks for one package manager to an executor.
+        Bulk-capable checkers get one task per chunk of packages, so chunks are
+        fetched concurrently; others get one task per package. A package listed
+        more than once is checked once, and its task answers every occurrence.
+
+        Args:
+            executor: Thread pool to run the checks on
+            pm: Package manager name (must have a checker)
+            packages: List of package names to validate
+
+        Returns:
+            Dictionary mapping each future (resolving to {package: found}) to the indices in packages it answers
+        """
+        checker = self.getChecker(pm)
+
+        def checkPackages(toCheck: List[str]) -> Dict[str, bool]:
+            """Check packages (for thread pool), consulting and updating the cache."""
+            found = {package: True for package in toCheck if self.cache.get(f"{pm}:{package}")}
+            uncached = [package for package in toCheck if package not in found]
+            if len(uncached) == 1 or (uncached and not checker.supportsBulk()):
+                found.update({package: checker.checkPackage(package) for package in uncached})
+            elif uncached:
+                found.update(checker.checkPackages(uncached))
+
+            # Only positive results are cached, so missing packages (or network failures) are rechecked
+            for package in uncached:
+                if found.get(package):
+                    self.cache.set(f"{pm}:{package}", True)
+            return found
+
+        indicesByPackage: Dict[str, List[int]] = {}
+        for i, pkg in enumerate(packages):
+            indicesByPackage.setdefault(pkg, []).append(i)
+        unique = list(indicesByPackage)
+
+        if checker.supportsBulk():
+            size = checker.BULK_CHUNK_SIZE
+            chunks = [unique[start:start + size] for start in range(0, len(unique), size)]
+            return {
+                executor.submit(checkPackages, chunk): [i for pkg in chunk for i in indicesByPackage[pkg]]
+                for chunk in chunks
+            }
+
+        return {executor.submit(checkPackages, [pkg]): indices for pkg, indices in indicesByPackage.items()}
+
+    def collectChecks(self, packages: List[str], futureToIndices: Dict[Future, List[int]]) -> List[Tuple[str, bool]]:
+        """
+        Collect submitted package checks, printing results in the original package order.
+        Each result is printed as soon as it and every package before it have completed,
+        so output is deterministic while still streaming.
+
+        Args:
+            packages: List of package names, in their original order
+            futureToIndices: Futures returned by submitChecks
+
+        Returns:
+            List of tuples (package_name, found), in the original order
+        """
+        results: List[Optional[Tuple[str, bool]]] = [None] * len(packages)
+        errors: Dict[int, Exception] = {}
+        nextToPrint = 0
+
+        for future in as_completed(futureToIndices):
+            indices = futureToIndices[future]
+            try:
+                found = future.result()
+                for index in indices:
+                    results[index] = (packages[index], found.get(packages[index], False))
+            except Exception as e:
+                for index in indices:
+                    results[index] = (packages[index], False)
+                    errors[index] = e
+
+            # Print the contiguous block of results that is now complete
+            while nextToPrint < len(results) and results[nextToPrint] is not None:
+                pkgName, found = results[nextToPrint]
+                if nextToPrint in errors:
+                    printError(f"✗ {pkgName}: Error - {errors[nextToPrint]}")
+                elif found:
+                    printSuccess(f"✓ {pkgName}")
+                else:
+                    printError(f"✗ {pkgName}")
+                nextToPrint += 1
+
+        return results
+
+    def validatePackageManager(self, pm: str, packages: List[str], maxWorkers: Optional[int] = None) -> List[Tuple[str, bool]]:
         """
         Validate packages for a specific package manager using parallel threads.
 
         Args:
             pm: Package manager name
             packages: List of package names to validate
-            maxWorkers: Maximum number of parallel threads (default: 10)
+            maxWorkers: Maximum number of parallel threads (default: self.poolSize)
 
         Returns:
             List of tuples (package_name, found)
         """
-        if pm not in self.checkers:
+        if not self.hasChecker(pm):
             printWarning(f"No checker implemented for {pm}, skipping")
             return [(pkg, True) for pkg in packages]
 
-        checker = self.checkers[pm]
-        results = []
+        # Use ThreadPoolExecutor for parallel API calls
+        with ThreadPoolExecutor(max_workers=maxWorkers or self.poolSize) as executor:
+            return self.collectChecks(packages, self.submitChecks(executor, pm, packages))
+
+    def validatePackageManagers(self, sections: Dict[str, List[str]], maxWorkers: Optional[int] = None) -> None:
+        """
+        Validate several package managers at once on a single shared thread pool.
 
-        def checkSinglePackage(package: str) -> Tuple[str, bool]:
-            """Check a single package (for thread pool)."""
-            found = checker.checkPackage(package)
-            return (package, found)
+        Every check is submitted up front, so requests for later package managers run
+        while earlier ones are still being reported, rather than each manager draining
+        its own pool in turn. Output stays grouped per package manager, in order.
+        Results are stored in self.results.
 
-        # Use ThreadPoolExecutor for parallel API calls
-        with ThreadPoolExecutor(max_workers=maxWorkers) as executor:
-            # Submit all package checks
-            futureToPackage = {
-                executor.submit(checkSinglePackage, pkg): pkg
-                for pkg in packages
+        Args:
+            sections: Package lists keyed by package manager name
+            maxWorkers: Maximum number of parallel threads across all managers (default: self.poolSize)
+        """
+        with ThreadPoolExecutor(max_workers=maxWorkers or self.poolSize) as executor:
+            pending = {
+                pm: self.submitChecks(executor, pm, packages)
+                for pm, packages in sections.items()
+                if self.hasChecker(pm)
             }
 
-            # Collect results as they complete
-            for future in as_completed(futureToPackage):
-                package = futureToPackage[future]
-                try:
-                    pkgName, found = future.result()
-                    results.append((pkgName, found))
-
-                    if found:
-                        printSuccess(f"✓ {pkgName}")
-                    else:
-                        printError(f"✗ {pkgName}")
-                except Exception as e:
-                    printError(f"✗ {package}: Error - {e}")
-                    results.append((package, False))
-
-        # Sort results by original package order
-        packageOrder = {pkg: i for i, pkg in enumerate(packages)}
-        results.sort(key=lambda x: packageOrder.get(x[0], 999))
+            for pm, packages in sections.items():
+                printInfo(f"\nValidating {len(packages)} {pm} packages...")
+                safePrint()
 
-        return results
+                if pm not in pending:
+                    printWarning(f"No checker implemented for {pm}, skipping")
+                    self.results[pm] = [(pkg, True) for pkg in packages]
+                    continue
+
+                self.results[pm] = self.collectChecks(packages, pending[pm])
 
     def printSummary(self) -> int:
         """Print validation summary and return exit code."""
@@ -285,6 +897,9 @@ def main():
         printInfo("Options:")
         printInfo("  --all        Validate all package managers (default)")
         printInfo("  --quiet      Suppress detailed output")
+        printInfo("  --legacy     Use legacy HTML scraping instead of JSON APIs (dnf)")
+        printInfo("  --no-cache   Ignore results and responses cached by previous runs")
+        printInfo(f"  --pool-size=N  Number of concurrent checks (default: {LinuxCommonValidator.DEFAULT_POOL_SIZE})")
         printInfo("  apt          Validate only APT packages")
         printInfo("  dnf          Validate only DNF packages")
         printInfo("  pacman       Validate only Pacman packages")
@@ -300,7 +915,17 @@ def main():
 
     # Parse arguments
     quiet = "--quiet" in sys.argv
-    checkAll = "--all" in sys.argv or len(sys.argv) == 2
+    legacy = "--legacy" in sys.argv
+    useCache = "--no-cache" not in sys.argv
+    poolSize = LinuxCommonValidator.DEFAULT_POOL_SIZE
+    for arg in sys.argv[2:]:
+        if arg.startswith("--pool-size="):
+            try:
+                poolSize = int(arg.split("=", 1)[1])
+            except ValueError:
+                printError(f"Invalid pool size: {arg}")
+                return 1
+    checkAll = "--all" in sys.argv or all(arg.startswith("--") for arg in sys.argv[2:])
 
     # Determine which package managers to check
     managersToCheck = ["apt", "dnf", "pacman", "zypper", "snap", "flatpak"] if checkAll else []
@@ -323,19 +948,25 @@ def main():
 
     # Create validator
     startTime = time.time()
-    validator = LinuxCommonValidator()
+    _cacheDnsLookups()
+    validator = LinuxCommonValidator(legacy=legacy, poolSize=poolSize, useCache=useCache)
+    printInfo(f"Pool size: {validator.poolSize} concurrent checks (tune with --pool-size=N)")
 
-    # Validate each requested package manager
+    # Gather each requested package manager's packages
+    sections: Dict[str, List[str]] = {}
     for pm in managersToCheck:
         packages = packageSections.get(pm, [])
         if not packages:
             printWarning(f"{pm}: No packages defined")
             continue
+        sections[pm] = packages
 
-        printInfo(f"\nValidating {len(packages)} {pm} packages...")
-        safePrint()
-        results = validator.validatePackageManager(pm, packages)
-        validator.results[pm] = results
+    # Validate all of them on one shared thread pool
+    try:
+        validator.validatePackageManagers(sections)
+    finally:
+        validator.close()
+    validator.saveCaches()
 
     elapsedTime = int(time.time() - startTime)
 
@@ -6,12 +6,17 @@ Uses OOP to abstract package manager validation logic.
 """
 
 import json
+import os
+import re
+import shutil
 import subprocess
 import sys
+import threading
 import time
 import urllib.error
 import urllib.request
 from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
@@ -22,8 +27,6 @@ sys.path.insert(0, str(projectRoot))
 
 from common.common import (
     commandExists,
-    getJsonArray,
-    getJsonValue,
     printError,
     printInfo,
     printH2,
@@ -60,6 +63,23 @@ class PackageManagerChecker(ABC):
         """
         pass
 
+    def checkPackages(self, packages: List[str]) -> Dict[str, bool]:
+        """
+        Check many packages at once.
+        The default checks them one at a time; checkers with a batch query override this.
+
+        Args:
+            packages: Package names/identifiers to check
+
+        Returns:
+            Dictionary mapping each package to whether it exists
+        """
+        return {package: self.checkPackage(package) for package in packages}
+
+    def supportsBatch(self) -> bool:
+        """Check if checkPackages answers many packages with a single query."""
+        return False
+
     @abstractmethod
     def isAvailable(self) -> bool:
         """
@@ -80,113 +100,129 @@ class PackageManagerChecker(ABC):
         return f"Please install {self.name} to validate packages."
 
 
-class BrewChecker(PackageManagerChecker):
-    """Checker for Homebrew packages."""
+class CommandChecker(PackageManagerChecker):
+    """
+    Checker driven by a package query command.
 
-    def __init__(self):
-        super().__init__("Homebrew", "brew")
+    Subclasses only declare queryCommand (the command line, without the package name);
+    a package exists if the command exits successfully. Subclasses whose command accepts
+    several names may also declare batchPattern to check many packages in one process.
+    """
+
+    queryCommand: List[str] = []
+    # Captures the name of each package found in the output of one query for many packages
+    batchPattern: Optional[re.Pattern] = None
 
     def isAvailable(self) -> bool:
-        return commandExists("brew")
+        return commandExists(self.queryCommand[0])
 
-    def checkPackage(self, package: str) -> bool:
-        """Check if a brew package exists."""
+    def runQuery(self, package: str) -> Optional[subprocess.CompletedProcess]:
+        """
+        Run the query command for a package.
+
+        Returns:
+            Completed process, or None if the command could not be run
+        """
         try:
-            result = subprocess.run(
-                ["brew", "info", package],
+            return subprocess.run(
+                self.queryCommand + [package],
                 capture_output=True,
-                text=True,
                 check=False,
             )
+        except Exception:
+            return None
 
-            if result.returncode == 0:
-                output = result.stdout
-                if any(marker in output for marker in [f"{package}:", "==>", "From:"]):
-                    return True
+    def runBatchQuery(self, command: List[str]) -> Optional[subprocess.CompletedProcess]:
+        """
+        Run a query for many packages, with untranslated output so it can be parsed.
 
-            return False
+        Returns:
+            Completed process, or None if the command could not be run
+        """
+        try:
+            return subprocess.run(
+                command,
+                capture_output=True,
+                check=False,
+                env={**os.environ, "LC_ALL": "C"},
+            )
         except Exception:
+            return None
+
+    def checkPackage(self, package: str) -> bool:
+        """Check if a package exists."""
+        result = self.runQuery(package)
+        return result is not None and result.returncode == 0
+
+    def supportsBatch(self) -> bool:
+        return self.batchPattern is not None
+
+    def checkPackages(self, packages: List[str]) -> Dict[str, bool]:
+        """Check many packages with a single query process when the command supports it."""
+        if self.batchPattern is None or len(packages) < 2:
+            return super().checkPackages(packages)
+
+        result = self.runBatchQuery(self.queryCommand + packages)
+        if result is None:
+            return super().checkPackages(packages)
+
+        # The command fails if any package is missing, so read what it did print
+        names = {name.decode("utf-8", errors="ignore") for name in self.batchPattern.findall(result.stdout)}
+        return {package: package in names for package in packages}
+
+
+class BrewChecker(CommandChecker):
+    """Checker for Homebrew packages."""
+
+    queryCommand = ["brew", "info"]
+
+    def __init__(self, name: str = "Homebrew", jsonKey: str = "brew"):
+        super().__init__(name, jsonKey)
+
+    def checkPackage(self, package: str) -> bool:
+        """Check if a brew package exists."""
+        result = self.runQuery(package)
+        if result is None or result.returncode != 0:
             return False
 
+        output = result.stdout.decode("utf-8", errors="ignore")
+        return any(marker in output for marker in [f"{package}:", "==>", "From:"])
+
     def getInstallHint(self) -> str:
         return 'Install with: /bin/bash -c "$(curl -fsSL https://raw.githubusercontent.com/Homebrew/install/HEAD/install.sh)"'
 
 
-class BrewCaskChecker(PackageManagerChecker):
+class BrewCaskChecker(BrewChecker):
     """Checker for Homebrew Cask packages."""
 
+    queryCommand = ["brew", "info", "--cask"]
+
     def __init__(self):
         super().__init__("Homebrew Cask", "brewCask")
 
-    def isAvailable(self) -> bool:
-        return commandExists("brew")
-
-    def checkPackage(self, package: str) -> bool:
-        """Check if a brew cask package exists."""
-        try:
-            result = subprocess.run(
-                ["brew", "info", "--cask", package],
-                capture_output=True,
-                text=True,
-                check=False,
-            )
-
-            if result.returncode == 0:
-                output = result.stdout
-                if any(marker in output for marker in [f"{package}:", "==>", "From:"]):
-                    return True
-
-            return False
-        except Exception:
-            return False
-
     def getInstallHint(self) -> str:
         return 'Install Homebrew first: /bin/bash -c "$(curl -fsSL https://raw.githubusercontent.com/Homebrew/install/HEAD/install.sh)"'
 
 
-class AptChecker(PackageManagerChecker):
+class AptChecker(CommandChecker):
     """Checker for APT packages (Debian/Ubuntu)."""
 
+    queryCommand = ["apt-cache", "show"]
+    batchPattern = re.compile(rb"^Package: (\S+)$", re.MULTILINE)
+
     def __init__(self):
         super().__init__("APT", "apt")
 
-    def isAvailable(self) -> bool:
-        return commandExists("apt-cache")
 
-    def checkPackage(self, package: str) -> bool:
-        """Check if an apt package exists."""
-        try:
-            result = subprocess.run(
-                ["apt-cache", "show", package],
-                capture_output=True,
-                check=False,
-            )
-            return result.returncode == 0
-        except Exception:
-            return False
-
-
-class SnapChecker(PackageManagerChecker):
+class SnapChecker(CommandChecker):
     """Checker for Snap packages."""
 
+    queryCommand = ["snap", "info"]
+    batchPattern = re.compile(rb"^name:\s+(\S+)$", re.MULTILINE)
+
     def __init__(self):
         super().__init__("Snap", "snap")
 
-    def isAvailable(self) -> bool:
-        return commandExists("snap")
-
-    def checkPackage(self, package: str) -> bool:
-        """Check if a snap package exists."""
-        try:
-            result = subprocess.run(
-                ["snap", "info", package],
-                capture_output=True,
-                check=False,
-            )
-            return result.returncode == 0
-        except Exception:
-            return False
-
 
 class WingetChecker(PackageManagerChecker):
     """Checker for Windows Package Manager (winget) packages."""
@@ -236,59 +272,36 @@ class WindowsStoreChecker(PackageManagerChecker):
         return True
 
 
-class YumChecker(PackageManagerChecker):
+class YumChecker(CommandChecker):
     """Checker for YUM packages (RHEL, CentOS)."""
 
+    queryCommand = ["yum", "info"]
+    batchPattern = re.compile(rb"^Name\s*: (\S+)$", re.MULTILINE)
+
     def __init__(self):
         super().__init__("YUM", "yum")
 
-    def isAvailable(self) -> bool:
-        return commandExists("yum")
-
-    def checkPackage(self, package: str) -> bool:
-        """Check if a yum package exists."""
-        try:
-            result = subprocess.run(
-                ["yum", "info", package],
-                capture_output=True,
-                check=False,
-            )
-            return result.returncode == 0
-        except Exception:
-            return False
 
-
-class DnfChecker(PackageManagerChecker):
+class DnfChecker(CommandChecker):
     """Checker for DNF packages (Fedora, newer RHEL)."""
 
+    queryCommand = ["dnf", "info"]
+    batchPattern = re.compile(rb"^Name\s*: (\S+)$", re.MULTILINE)
+
     def __init__(self):
         super().__init__("DNF", "dnf")
 
-    def isAvailable(self) -> bool:
-        return commandExists("dnf")
-
-    def checkPackage(self, package: str) -> bool:
-        """Check if a dnf package exists."""
-        try:
-            result = subprocess.run(
-                ["dnf", "info", package],
-                capture_output=True,
-                check=False,
-            )
-            return result.returncode == 0
-        except Exception:
-            return False
 
-
-class RpmChecker(PackageManagerChecker):
+class RpmChecker(CommandChecker):
     """Checker for RPM packages (generic RPM-based systems)."""
 
+    queryCommand = ["rpm", "-q"]
+    # Batched queries print just the name of each installed package
+    batchPattern = re.compile(rb"^(\S+)$", re.MULTILINE)
+
     def __init__(self):
         super().__init__("RPM", "rpm")
 
-    def isAvailable(self) -> bool:
-        return commandExists("rpm")
-
     def checkPackage(self, package: str) -> bool:
         """
         Check if an rpm package exists.
@@ -317,6 +330,20 @@ class RpmChecker(PackageManagerChecker):
         except Exception:
             return False
 
+    def checkPackages(self, packages: List[str]) -> Dict[str, bool]:
+        """Check many rpm packages with a single rpm -q process."""
+        if len(packages) < 2:
+            return super().checkPackages(packages)
+
+        result = self.runBatchQuery(self.queryCommand + ["--queryformat", "%{NAME}\n"] + packages)
+        if result is None:
+            return super().checkPackages(packages)
+
+        # Only bare names come back, so entries written as name-version or name.arch, and
+        # anything else not in the output, are checked on their own to match checkPackage
+        found = {name.decode("utf-8", errors="ignore") for name in self.batchPattern.findall(result.stdout)}
+        return {package: package in found or self.checkPackage(package) for package in packages}
+
 
 class PackageValidator:
     """Main validator class that orchestrates package validation."""
@@ -337,6 +364,15 @@ class PackageValidator:
     # Linux package managers for linuxCommon validation
     LINUX_PACKAGE_MANAGERS = ["apt", "yum", "dnf", "rpm"]
 
+    # Package managers that can reuse an earlier manager's answer when both commands
+    # resolve to the same executable (yum is a symlink to dnf on Fedora and RHEL 8+)
+    EQUIVALENT_PACKAGE_MANAGERS: Dict[str, str] = {
+        "dnf": "yum",
+    }
+
+    # Number of packages checked concurrently (each check is a subprocess or HTTP call)
+    DEFAULT_POOL_SIZE = 8
+
     def __init__(self, configPath: str):
         """
         Initialise package validator.
@@ -347,6 +383,10 @@ class PackageValidator:
         self.configPath = Path(configPath)
         self.config = {}
         self.checkers: Dict[str, PackageManagerChecker] = {}
+        self.sharedResults: Dict[str, str] = {}
+        self.packageCache: Dict[Tuple[str, str], bool] = {}
+        self.packageCacheLock = threading.Lock()
+        self.poolSize = self.DEFAULT_POOL_SIZE
         self.errors = 0
 
         if not self.configPath.exists():
@@ -369,6 +409,11 @@ class PackageValidator:
                     checker = self.CHECKERS[pmKey]()
                     if checker.isAvailable():
                         self.checkers[pmKey] = checker
+
+            # Skip redundant lookups for managers that are really the same binary
+            for pmKey, sourceKey in self.EQUIVALENT_PACKAGE_MANAGERS.items():
+                if pmKey in self.checkers and sourceKey in self.checkers and self.isSameExecutable(pmKey, sourceKey):
+                    self.sharedResults[pmKey] = sourceKey
         else:
             # Normal config - use package managers specified in JSON
             for jsonKey, checkerClass in self.CHECKERS.items():
@@ -377,6 +422,68 @@ class PackageValidator:
                     checker = checkerClass()
                     self.checkers[jsonKey] = checker
 
+    @staticmethod
+    def isSameExecutable(firstCommand: str, secondCommand: str) -> bool:
+        """Check if two commands resolve to the same executable on PATH."""
+        firstPath = shutil.which(firstCommand)
+        secondPath = shutil.which(secondCommand)
+        if not firstPath or not secondPath:
+            return False
+        return os.path.realpath(firstPath) == os.path.realpath(secondPath)
+
+    def checkPackages(self, pmKey: str, checker: PackageManagerChecker, packages: List[str]) -> Dict[str, bool]:
+        """
+        Check packages with a checker, querying each (package manager, package) pair only once.
+        Uncached packages are passed to the checker together, so batch-capable checkers
+        answer them with a single query.
+
+        Args:
+            pmKey: Package manager key the checker is registered under
+            checker: Checker to query on a cache miss
+            packages: Package names
+
+        Returns:
+            Dictionary mapping each package to whether it exists
+        """
+        with self.packageCacheLock:
+            uncached = [package for package in dict.fromkeys(packages) if (pmKey, package) not in self.packageCache]
+
+        if uncached:
+            found = checker.checkPackages(uncached)
+            with self.packageCacheLock:
+                for package in uncached:
+                    self.packageCache[(pmKey, package)] = found.get(package, False)
+
+        with self.packageCacheLock:
+            return {package: self.packageCache[(pmKey, package)] for package in packages}
+
+    def submitChecks(
+        self,
+        executor: ThreadPoolExecutor,
+        pmKey: str,
+        checker: PackageManagerChecker,
+        packages: List[str],
+    ) -> List[Future]:
+        """
+        Submit checks for a package manager's packages to an executor.
+        Batch-capable checkers get one task for all packages; others get one task per
+        distinct package, shared by every occurrence of it.
+
+        Args:
+            executor: Thread pool to run the checks on
+            pmKey: Package manager key the checker is registered under
+            checker: Checker to query
+            packages: Package names
+
+        Returns:
+            One future per package, in order, each resolving to a {package: found} dictionary
+        """
+        if checker.supportsBatch():
+            return [executor.submit(self.checkPackages, pmKey, checker, packages)] * len(packages)
+
+        futures = {package: executor.submit(self.checkPackages, pmKey, checker, [package]) for package in dict.fromkeys(packages)}
+        return [futures[package] for package in packages]
+
     def getPlatformName(self) -> str:
         """Get platform name from config file name."""
         name = self.configPath.stem
@@ -394,25 +501,43 @@ class PackageValidator:
         """Check if this is a linuxCommon config file."""
         return self.configPath.stem == "linuxCommon" or "linuxCommon" in self.config
 
+    @staticmethod
+    def getPackageList(config: Dict, key: str) -> List[str]:
+        """
+        Get a package list from an already-loaded config.
+
+        Args:
+            config: Parsed JSON config
+            key: Top-level key holding the package list
+
+        Returns:
+            List of package names (empty if the key is missing or not a list);
+            entries that are not strings, such as null or nested objects, are skipped
+        """
+        packages = config.get(key, [])
+        if not isinstance(packages, list):
+            return []
+        return [package for package in packages if isinstance(package, str)]
+
     def mergeLinuxCommon(self) -> List[str]:
         """Merge linuxCommon packages if enabled."""
-        aptPackages = []
+        aptPackages = self.getPackageList(self.config, "apt")
 
         # Check if linuxCommon is enabled
-        useLinuxCommon = getJsonValue(str(self.configPath), ".useLinuxCommon", False)
-
-        if useLinuxCommon:
+        if self.config.get("useLinuxCommon", False):
             commonConfigPath = self.configPath.parent / "linuxCommon.json"
             if commonConfigPath.exists():
                 printInfo("Merging linuxCommon packages...")
-                commonPackages = getJsonArray(str(commonConfigPath), ".linuxCommon[]?")
-                distroPackages = getJsonArray(str(self.configPath), ".apt[]?")
+                try:
+                    with open(commonConfigPath, "r", encoding="utf-8") as f:
+                        commonConfig = json.load(f)
+                except (OSError, json.JSONDecodeError) as e:
+                    printWarning(f"Skipping unreadable {commonConfigPath.name}: {e}")
+                    commonConfig = {}
+                if not isinstance(commonConfig, dict):
+                    commonConfig = {}
                 # Merge and deduplicate
-                aptPackages = sorted(list(set(commonPackages + distroPackages)))
-            else:
-                aptPackages = getJsonArray(str(self.configPath), ".apt[]?")
-        else:
-            aptPackages = getJsonArray(str(self.configPath), ".apt[]?")
+                aptPackages = sorted(set(self.getPackageList(commonConfig, "linuxCommon") + aptPackages))
 
         return aptPackages
 
@@ -429,7 +554,7 @@ class PackageValidator:
 
         # Special handling for linuxCommon.json - validate against all available Linux package managers
         if self.isLinuxCommon():
-            packages = getJsonArray(str(self.configPath), ".linuxCommon[]?")
+            packages = self.getPackageList(self.config, "linuxCommon")
             if not packages:
                 printWarning("No packages found in linuxCommon.json")
                 return 0
@@ -444,21 +569,18 @@ class PackageValidator:
                 printInfo(f"- {self.checkers[pmKey].name}")
             safePrint()
 
-            # Validate each package against all available package managers
-            for package in packages:
-                if not package or not package.strip():
-                    continue
-
-                package = package.strip()
-                foundIn = []
-                notFoundIn = []
+            # Query each package manager once for every package, all managers at the same time
+            packages = [package.strip() for package in packages if package and package.strip()]
+            queriedKeys = [pmKey for pmKey in self.checkers if pmKey not in self.sharedResults]
+            with ThreadPoolExecutor(max_workers=self.poolSize) as executor:
+                results = executor.map(lambda pmKey: self.checkPackages(pmKey, self.checkers[pmKey], packages), queriedKeys)
+                foundByKey: Dict[str, Dict[str, bool]] = dict(zip(queriedKeys, results))
+            for pmKey, sourceKey in self.sharedResults.items():
+                foundByKey[pmKey] = foundByKey[sourceKey]
 
-                # Check package against all available package managers
-                for pmKey, checker in self.checkers.items():
-                    if checker.checkPackage(package):
-                        foundIn.append(checker.name)
-                    else:
-                        notFoundIn.append(checker.name)
+            for package in packages:
+                foundIn = [checker.name for pmKey, checker in self.checkers.items() if foundByKey[pmKey][package]]
+                notFoundIn = [checker.name for pmKey, checker in self.checkers.items() if not foundByKey[pmKey][package]]
 
                 # Report results
                 if foundIn:
@@ -475,37 +597,45 @@ class PackageValidator:
                     self.errors += 1
         else:
             # Normal validation for platform-specific configs
+            sections: List[Tuple[str, PackageManagerChecker, List[str]]] = []
             for jsonKey, checker in self.checkers.items():
                 if jsonKey == "apt" and self.config.get("useLinuxCommon") is True:
                     # Special handling for apt with linuxCommon
                     packages = self.mergeLinuxCommon()
                 else:
-                    packages = getJsonArray(str(self.configPath), f".{jsonKey}[]?")
-
-                if not packages:
-                    continue
-
-                # Check if package manager is available
-                if not checker.isAvailable():
-                    printWarning(f"{checker.name} is not available, skipping {jsonKey} package validation")
-                    printInfo(f"{checker.getInstallHint()}")
-                    safePrint()
-                    continue
-
-                # Validate packages
-                printInfo(f"Validating {checker.name.lower()} packages...")
-                for package in packages:
-                    if not package or not package.strip():
+                    packages = self.getPackageList(self.config, jsonKey)
+
+                packages = [package.strip() for package in packages if package and package.strip()]
+                if packages:
+                    sections.append((jsonKey, checker, packages))
+
+            # Submit every available package manager's checks up front so they overlap,
+            # then report them per package manager, in order, as results arrive
+            with ThreadPoolExecutor(max_workers=self.poolSize) as executor:
+                pending = [
+                    (jsonKey, checker, packages, self.submitChecks(executor, jsonKey, checker, packages) if checker.isAvailable() else None)
+                    for jsonKey, checker, packages in sections
+                ]
+
+                for jsonKey, checker, packages, futures in pending:
+                    # Check if package manager is available
+                    if futures is None:
+                        printWarning(f"{checker.name} is not available, skipping {jsonKey} package validation")
+                        printInfo(f"{checker.getInstallHint()}")
+                        safePrint()
                         continue
 
-                    package = package.strip()
-                    if checker.checkPackage(package):
-                        printSuccess(f"{package}")
-                    else:
-                        printError(f"{package} (not found in {checker.name.lower()})")
-                        self.errors += 1
+                    # Validate packages
+                    displayName = checker.name.lower()
+                    printInfo(f"Validating {displayName} packages...")
+                    for package, future in zip(packages, futures):
+                        if future.result()[package]:
+                            printSuccess(f"{package}")
+                        else:
+                            printError(f"{package} (not found in {displayName})")
+                            self.errors += 1
 
-                safePrint()
+                    safePrint()
 
         # Summary
         if self.errors == 0:
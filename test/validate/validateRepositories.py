@@ -4,32 +4,90 @@ Enhanced validation for repositories config.
 Checks if repositories exist and validates work paths.
 """
 
+import importlib.util
 import json
+import os
 import re
+import string
 import subprocess
 import sys
+import threading
 import time
-import urllib.error
-import urllib.request
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit, urlunsplit
 
-# Add project root to path so we can import from common
-scriptDir = Path(__file__).parent.absolute()
-projectRoot = scriptDir.parent.parent
-sys.path.insert(0, str(projectRoot))
+# Add project root to path so we can import from common when run as a script.
+# Importers (e.g. the unit tests) already have it on sys.path.
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent.absolute()))
 
 from common.common import (
     commandExists,
-    getJsonArray,
-    getJsonValue,
     printError,
     printInfo,
     printH2,
     printSuccess,
     printWarning,
     safePrint,
+    TtlCache,
+)
+
+# Patterns applied to every repository entry are compiled once at import
+_WILDCARD_PATTERN = re.compile(r'^(https://github\.com/|git@github\.com:)[^/]+/\*$')
+# Splits a repository URL into host and path in one pass; exactly one alternative matches
+_REPO_URL_PATTERN = re.compile(
+    r'^(?:'
+    r'git@(?P<sshHost>[^:/]+):(?P<sshRepo>.+?)(?:\.git)?'
+    r'|(?P<scheme>https?)://(?P<httpHost>[^/]+)/(?P<httpRepo>.+?)(?:\.git)?/?'
+    r'|(?P<gitUrl>git://.+)'
+    r')$'
 )
+GITHUB_HOST = "github.com"
+# Any repository URL starts with one of these; checked before running a regex
+_REPO_URL_PREFIXES = ("https://", "http://", "git://", "git@")
+# Work paths must start with one of these (or, on Windows, a drive letter)
+_UNIX_PATH_PREFIXES = ("~", "/", "$HOME", "$USER")
+_WINDOWS_PATH_PREFIXES = ("\\\\", "$USERPROFILE", "$HOME")
+
+# Upper bound on concurrent repository checks (each is a network round trip)
+MAX_WORKERS = 16
+
+# GitHub REST API, queried over one keep-alive connection per worker thread
+GITHUB_API_HOST = "api.github.com"
+GITHUB_API_TIMEOUT = 10
+_GITHUB_HEADERS = {
+    'User-Agent': 'jrl_env-validator',
+    'Accept': 'application/vnd.github+json',
+}
+_githubConnections = threading.local()
+
+# Repositories per GraphQL query when checking in bulk (needs GITHUB_TOKEN)
+GRAPHQL_BATCH_SIZE = 100
+
+# Repositories found via the API are trusted for a day, then revalidated with
+# If-None-Match; with a GITHUB_TOKEN, a 304 reply does not count against the rate limit
+_githubCache = TtlCache('gh_repos.json', timedelta(hours=24))
+
+# Once a REST response reports the API quota used up, further REST checks are skipped
+# locally until it resets (epoch seconds, from X-RateLimit-Reset). GraphQL has a
+# separate quota, so its responses are not recorded here
+_rateLimitResetAt = 0.0
+_rateLimitLock = threading.Lock()
+
+# Git smart HTTP: a repository answers this with a ref advertisement of this type
+SMART_HTTP_TIMEOUT = 10
+_SMART_HTTP_CONTENT_TYPE = 'application/x-git-upload-pack-advertisement'
+
+# Print helper for each status returned by checkRepository
+_REPORTERS = {
+    "success": printSuccess,
+    "warning": printWarning,
+    "error": printError,
+}
 
 
 def validateUnixPath(path: str) -> bool:
@@ -44,8 +102,7 @@ def validateUnixPath(path: str) -> bool:
     """
     # Check for valid path characters (basic validation)
     # Should start with ~, /, $HOME, or $USER
-    pattern = r'^(~|/|\$HOME|\$USER)'
-    return bool(re.match(pattern, path))
+    return path.startswith(_UNIX_PATH_PREFIXES)
 
 
 def validateWindowsPath(path: str) -> bool:
@@ -60,8 +117,8 @@ def validateWindowsPath(path: str) -> bool:
     """
     # Check for valid Windows path (drive letter or UNC)
     # Should start with drive letter, \\, $USERPROFILE, or $HOME
-    pattern = r'^([A-Za-z]:|\\\\|\$USERPROFILE|\$HOME)'
-    return bool(re.match(pattern, path))
+    hasDriveLetter = len(path) >= 2 and path[1] == ':' and path[0] in string.ascii_letters
+    return hasDriveLetter or path.startswith(_WINDOWS_PATH_PREFIXES)
 
 
 def convertSshToHttps(repoUrl: str) -> Optional[str]:
@@ -75,14 +132,227 @@ def convertSshToHttps(repoUrl: str) -> Optional[str]:
         HTTPS URL if conversion successful, None otherwise
     """
     # Convert git@github.com:owner/repo.git to https://github.com/owner/repo
-    match = re.match(r'^git@github\.com:(.+?)(?:\.git)?$', repoUrl)
-    if match:
-        ownerRepo = match.group(1)
+    if not repoUrl.startswith("git@github.com:"):
+        return None
+
+    ownerRepo = repoUrl.removeprefix("git@github.com:").removesuffix(".git")
+    if ownerRepo:
         return f"https://github.com/{ownerRepo}"
 
     return None
 
 
+@lru_cache(maxsize=1)
+def _gitAvailable() -> bool:
+    """Check if git is on PATH, once per process."""
+    return commandExists("git")
+
+
+@lru_cache(maxsize=1)
+def _getSslContext():
+    """Get the TLS context shared by every worker's connection, so system CAs are loaded once."""
+    import ssl
+
+    return ssl.create_default_context()
+
+
+def _getGitHubConnection():
+    """Get this thread's connection to the GitHub API, creating it if needed."""
+    # Deferred: http.client pulls in ssl and email, and is only needed once the
+    # first repository is actually checked over HTTP/1.1
+    import http.client
+
+    connection = getattr(_githubConnections, 'connection', None)
+    if connection is None:
+        connection = http.client.HTTPSConnection(GITHUB_API_HOST, timeout=GITHUB_API_TIMEOUT, context=_getSslContext())
+        _githubConnections.connection = connection
+    return connection
+
+
+def _dropGitHubConnection() -> None:
+    """Close and forget this thread's connection to the GitHub API."""
+    connection = getattr(_githubConnections, 'connection', None)
+    _githubConnections.connection = None
+    if connection is not None:
+        connection.close()
+
+
+@lru_cache(maxsize=1)
+def _getHttp2Client():
+    """
+    Get the shared HTTP/2 client for the GitHub API, if httpx and h2 are installed.
+    Checks from every worker thread are then multiplexed over one connection.
+
+    Returns:
+        httpx.Client, or None to use a keep-alive connection per thread instead
+    """
+    if importlib.util.find_spec("httpx") is None or importlib.util.find_spec("h2") is None:
+        return None
+
+    import httpx
+
+    return httpx.Client(
+        http2=True,
+        base_url=f"https://{GITHUB_API_HOST}",
+        headers=_GITHUB_HEADERS,
+        timeout=GITHUB_API_TIMEOUT,
+    )
+
+
+def _recordRateLimit(remaining: Optional[str], reset: Optional[str]) -> None:
+    """Remember when the API quota resets if X-RateLimit-Remaining says it is used up."""
+    global _rateLimitResetAt
+
+    if remaining != '0' or not reset:
+        return
+
+    try:
+        resetAt = float(reset)
+    except ValueError:
+        return
+
+    with _rateLimitLock:
+        _rateLimitResetAt = max(_rateLimitResetAt, resetAt)
+
+
+def _getRateLimitMessage() -> Optional[str]:
+    """Get a message saying when the API quota resets, or None if it is not used up."""
+    if time.time() >= _rateLimitResetAt:
+        return None
+
+    resetTime = time.strftime('%H:%M:%S', time.localtime(_rateLimitResetAt))
+    return f"GitHub API rate limit exceeded (resets at {resetTime})"
+
+
+def _sendGitHubRequest(
+    method: str,
+    path: str,
+    headers: Dict[str, str],
+    body: Optional[bytes] = None,
+) -> Optional[Tuple[int, Any, bytes]]:
+    """
+    Send a request to the GitHub API, over HTTP/2 if available or else over this
+    thread's keep-alive connection (reconnecting once if the server closed it while idle).
+
+    Args:
+        method: HTTP method
+        path: Request path
+        headers: Request headers
+        body: Request body, if any
+
+    Returns:
+        Tuple of (status, headers, body), or None on a network error
+    """
+    http2Client = _getHttp2Client()
+    if http2Client is not None:
+        import httpx
+
+        try:
+            response = http2Client.request(method, path, headers=headers, content=body)
+        except httpx.HTTPError:
+            return None
+        responseHeaders, content, status = response.headers, response.content, response.status_code
+    else:
+        import http.client
+
+        while True:
+            connection = _getGitHubConnection()
+            reused = connection.sock is not None
+            try:
+                connection.request(method, path, body=body, headers=headers)
+                response = connection.getresponse()
+                # Read the whole response so the connection can carry the next request
+                content = response.read()
+                responseHeaders, status = response.headers, response.status
+                break
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                _dropGitHubConnection()
+                if not reused:
+                    return None
+            except (OSError, http.client.HTTPException):
+                _dropGitHubConnection()
+                return None
+
+    return status, responseHeaders, content
+
+
+def _githubRequest(path: str, etag: Optional[str] = None) -> Tuple[Optional[int], Optional[str]]:
+    """
+    Send a HEAD request to the GitHub API, authenticated if GITHUB_TOKEN is set
+    (a higher rate limit, and conditional requests answered 304 are free).
+    Only the status and headers are needed, so no body is transferred.
+
+    Args:
+        path: Request path
+        etag: ETag from a previous response, to make the request conditional
+
+    Returns:
+        Tuple of (status, etag); status is None on a network error
+    """
+    headers = dict(_GITHUB_HEADERS)
+    token = os.getenv('GITHUB_TOKEN')
+    if token:
+        headers['Authorization'] = f'bearer {token}'
+    if etag:
+        headers['If-None-Match'] = etag
+
+    result = _sendGitHubRequest('HEAD', path, headers)
+    if result is None:
+        return None, None
+
+    status, responseHeaders, _ = result
+    _recordRateLimit(responseHeaders.get('X-RateLimit-Remaining'), responseHeaders.get('X-RateLimit-Reset'))
+    return status, responseHeaders.get('ETag')
+
+
+def _queryGitHubGraphQl(query: str, token: str) -> Optional[Dict[str, Any]]:
+    """
+    Run a GitHub GraphQL query.
+
+    Args:
+        query: GraphQL query
+        token: GitHub token (the GraphQL API does not allow anonymous access)
+
+    Returns:
+        The response's "data" object, or None if the query failed
+    """
+    headers = dict(_GITHUB_HEADERS)
+    headers['Authorization'] = f'bearer {token}'
+    headers['Content-Type'] = 'application/json'
+
+    result = _sendGitHubRequest('POST', '/graphql', headers, json.dumps({'query': query}).encode('utf-8'))
+    if result is None or result[0] != 200:
+        return None
+
+    try:
+        data = json.loads(result[2]).get('data')
+    except (ValueError, AttributeError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def canonicalizeRepoUrl(repoUrl: str) -> str:
+    """
+    Get a canonical form of a repository URL, so that entries naming the same
+    repository are only checked once.
+
+    GitHub SSH URLs become HTTPS URLs (both are checked through the same API call),
+    the host is lowercased, and any trailing "/" or ".git" is dropped.
+
+    Args:
+        repoUrl: Repository URL
+
+    Returns:
+        Canonical URL
+    """
+    repoUrl = convertSshToHttps(repoUrl) or repoUrl
+    if '://' in repoUrl:
+        parts = urlsplit(repoUrl)
+        repoUrl = urlunsplit(parts._replace(netloc=parts.netloc.lower()))
+
+    return repoUrl.rstrip('/').removesuffix('.git')
+
+
 def checkGitHubRepository(ownerRepo: str) -> Tuple[Optional[bool], str]:
     """
     Check if a GitHub repository exists via API.
@@ -94,30 +364,144 @@ def checkGitHubRepository(ownerRepo: str) -> Tuple[Optional[bool], str]:
         Tuple of (exists: bool|None, message: str)
         None means we couldn't determine (network error, etc.)
     """
-    apiUrl = f"https://api.github.com/repos/{ownerRepo}"
+    # GitHub names are case-insensitive
+    cacheKey = ownerRepo.lower()
+    cachedEntry = _githubCache.getEntry(cacheKey)
+    cached = cachedEntry.get('value') if cachedEntry else None
+    if cached and _githubCache.isFresh(cachedEntry):
+        return True, cached['message']
+
+    # Every request would only get a 403 until the quota resets
+    rateLimitMessage = _getRateLimitMessage()
+    if rateLimitMessage:
+        return None, rateLimitMessage
 
     try:
-        req = urllib.request.Request(apiUrl)
-        req.add_header('User-Agent', 'jrl_env-validator')
-
-        with urllib.request.urlopen(req, timeout=10) as response:
-            if response.status == 200:
-                return True, "Repository exists"
-            else:
-                return False, f"Unexpected status: {response.status}"
-    except urllib.error.HTTPError as e:
-        if e.code == 404:
-            # Could be private repo or doesn't exist
-            return None, "Repository not found or is private (404)"
-        elif e.code == 403:
-            return None, "Repository access forbidden (403) - may be private or rate limited"
-        else:
-            return None, f"HTTP error: {e.code}"
-    except urllib.error.URLError:
-        return None, "Could not reach GitHub API - network issue or timeout"
+        status, etag = _githubRequest(f"/repos/{ownerRepo}", cached['etag'] if cached else None)
     except Exception as e:
         return None, f"Error: {str(e)}"
 
+    if status is None:
+        return None, "Could not reach GitHub API - network issue or timeout"
+
+    if status == 304 and cached:
+        # Unchanged since it was cached
+        _githubCache.set(cacheKey, cached)
+        return True, cached['message']
+
+    if status in (200, 301, 302, 307):
+        # Renamed or transferred repositories redirect to their new location
+        message = "Repository exists" if status == 200 else "Repository exists (moved)"
+        # Only found repositories are cached; anything else is retried next run
+        _githubCache.set(cacheKey, {'message': message, 'etag': etag})
+        return True, message
+    elif status == 404:
+        # Could be private repo or doesn't exist
+        return None, "Repository not found or is private (404)"
+    elif status == 403:
+        return None, _getRateLimitMessage() or "Repository access forbidden (403) - may be private or rate limited"
+    elif status >= 400:
+        return None, f"HTTP error: {status}"
+    else:
+        return False, f"Unexpected status: {status}"
+
+
+def checkGitHubRepositories(ownerRepos: List[str]) -> Dict[str, Tuple[Optional[bool], str]]:
+    """
+    Check many GitHub repositories at once, with one GraphQL query per
+    GRAPHQL_BATCH_SIZE repositories instead of a REST call each.
+    Only possible with a GITHUB_TOKEN; repositories cached as existing are not queried.
+
+    Args:
+        ownerRepos: Repositories in format "owner/repo"
+
+    Returns:
+        Results keyed by "owner/repo", as returned by checkGitHubRepository.
+        Repositories missing from it (no token, query failed, etc.) should be
+        checked individually with checkGitHubRepository.
+    """
+    token = os.getenv('GITHUB_TOKEN')
+    if not token:
+        return {}
+
+    results: Dict[str, Tuple[Optional[bool], str]] = {}
+    pending = []
+    for ownerRepo in dict.fromkeys(ownerRepos):
+        cached = _githubCache.get(ownerRepo.lower())
+        if cached:
+            results[ownerRepo] = (True, cached['message'])
+        elif ownerRepo.count('/') == 1:
+            pending.append(ownerRepo)
+
+    for start in range(0, len(pending), GRAPHQL_BATCH_SIZE):
+        batch = pending[start:start + GRAPHQL_BATCH_SIZE]
+
+        # One aliased field per repository; JSON string syntax is valid GraphQL
+        fields = []
+        for index, ownerRepo in enumerate(batch):
+            owner, name = ownerRepo.split('/')
+            fields.append(f"r{index}: repository(owner: {json.dumps(owner)}, name: {json.dumps(name)}) {{ nameWithOwner }}")
+
+        data = _queryGitHubGraphQl(f"query {{ {' '.join(fields)} }}", token)
+        if data is None:
+            continue
+
+        for index, ownerRepo in enumerate(batch):
+            alias = f"r{index}"
+            if data.get(alias):
+                results[ownerRepo] = (True, "Repository exists")
+                _githubCache.set(ownerRepo.lower(), {'message': "Repository exists", 'etag': None})
+            elif alias in data:
+                # Null: no such repository, or the token cannot see it
+                results[ownerRepo] = (None, "Repository not found or not accessible with GITHUB_TOKEN")
+
+    return results
+
+
+def probeSmartHttp(repoUrl: str) -> bool:
+    """
+    Check if an HTTP(S) Git repository exists using the smart HTTP ref advertisement,
+    without spawning git.
+
+    Args:
+        repoUrl: Repository URL (http:// or https://)
+
+    Returns:
+        True if the server advertised refs, False if it did not or could not be reached
+    """
+    import http.client
+    import urllib.error
+    import urllib.request
+
+    infoRefsUrl = repoUrl.rstrip('/') + '/info/refs?service=git-upload-pack'
+
+    try:
+        req = urllib.request.Request(infoRefsUrl)
+        # Some hosts only serve the smart protocol to Git clients
+        req.add_header('User-Agent', 'git/2.0 (jrl_env-validator)')
+
+        # Only the headers are needed; the ref list itself can be large
+        with urllib.request.urlopen(req, timeout=SMART_HTTP_TIMEOUT) as response:
+            contentType = response.headers.get('Content-Type', '')
+            return response.status == 200 and contentType.startswith(_SMART_HTTP_CONTENT_TYPE)
+    except (urllib.error.URLError, OSError, ValueError, http.client.HTTPException):
+        # HTTPException (a bad status line, a truncated reply) is not an OSError
+        return False
+
+
+@lru_cache(maxsize=1)
+def _getGitEnv() -> Dict[str, str]:
+    """
+    Get the environment for git ls-remote, built once and shared by every check.
+    Prompts are disabled so a repository needing credentials fails straight away
+    instead of blocking a worker until the timeout.
+    """
+    env = os.environ.copy()
+    env['GIT_TERMINAL_PROMPT'] = '0'
+    # An empty GIT_ASKPASS also stops git falling back to core.askPass or SSH_ASKPASS
+    env['GIT_ASKPASS'] = ''
+    return env
+
 
 def checkGitRepository(repoUrl: str) -> bool:
     """
@@ -133,6 +517,8 @@ def checkGitRepository(repoUrl: str) -> bool:
         result = subprocess.run(
             ["git", "ls-remote", repoUrl],
             capture_output=True,
+            stdin=subprocess.DEVNULL,
+            env=_getGitEnv(),
             timeout=10,
             check=False,
         )
@@ -143,6 +529,82 @@ def checkGitRepository(repoUrl: str) -> bool:
         return False
 
 
+def classifyRepoUrl(repoUrl: str) -> Tuple[str, Optional[str]]:
+    """
+    Classify a repository URL by how it can be checked, without any I/O.
+
+    Args:
+        repoUrl: Repository URL
+
+    Returns:
+        Tuple of (kind, ownerRepo). kind is "github" (GitHub SSH or HTTPS URL),
+        "ssh" (other SSH URL), "http" (other HTTP(S) URL), "git" (git:// URL), or
+        "invalid". ownerRepo is "owner/repo" for GitHub URLs, None otherwise.
+    """
+    match = _REPO_URL_PATTERN.match(repoUrl) if repoUrl.startswith(_REPO_URL_PREFIXES) else None
+    if not match:
+        return "invalid", None
+
+    sshHost = match['sshHost']
+    httpHost = match['httpHost']
+
+    if sshHost is not None:
+        if sshHost.lower() == GITHUB_HOST:
+            return "github", match['sshRepo']
+        return "ssh", None
+
+    if httpHost is not None:
+        if match['scheme'] == 'https' and httpHost.lower() == GITHUB_HOST:
+            return "github", match['httpRepo']
+        return "http", None
+
+    return "git", None
+
+
+def checkRepository(
+    repoUrl: str,
+    kind: str,
+    ownerRepo: Optional[str] = None,
+    githubResults: Optional[Dict[str, Tuple[Optional[bool], str]]] = None,
+) -> Tuple[str, str]:
+    """
+    Check a repository URL classified by classifyRepoUrl, using the GitHub API,
+    smart HTTP, or git ls-remote as appropriate.
+    Does not print, so it can run on a worker thread.
+
+    Args:
+        repoUrl: Repository URL
+        kind: URL kind from classifyRepoUrl
+        ownerRepo: "owner/repo" for GitHub URLs
+        githubResults: Results already fetched by checkGitHubRepositories, if any
+
+    Returns:
+        Tuple of (status, message) where status is "success", "warning", or "error"
+    """
+    if kind == "invalid":
+        return "error", "Invalid repository URL format"
+
+    if kind == "ssh":
+        # Other SSH URLs - can't easily validate without SSH keys
+        return "warning", "SSH URL detected - cannot validate without SSH keys (format is valid)"
+
+    if kind == "github":
+        # GitHub URL (SSH or HTTPS) - check via the API
+        exists, message = (githubResults or {}).get(ownerRepo) or checkGitHubRepository(ownerRepo)
+        if exists:
+            return "success", "Repository exists"
+        return "warning", f"{message} - will be validated at clone time"
+
+    # Other HTTPS URLs - probe over HTTP first, since most hosts support it
+    if kind == "http" and probeSmartHttp(repoUrl):
+        return "success", "Repository exists"
+
+    # Otherwise (git:// or no smart HTTP support) try git ls-remote
+    if checkGitRepository(repoUrl):
+        return "success", "Repository exists"
+    return "error", "Repository not accessible or does not exist"
+
+
 def validateRepositories(configPath: str) -> int:
     """
     Validate repositories from config file.
@@ -153,19 +615,13 @@ def validateRepositories(configPath: str) -> int:
     Returns:
         0 if all repositories are valid, 1 otherwise
     """
-    configFile = Path(configPath)
-
-    if not configFile.exists():
+    # Read and parse in one go; the parsed config is used for everything below
+    try:
+        with open(configPath, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+    except FileNotFoundError:
         printError(f"Config file not found: {configPath}")
         return 1
-
-    printH2("Validating Repositories Config")
-    safePrint()
-
-    # Validate JSON syntax
-    try:
-        with open(configFile, 'r', encoding='utf-8') as f:
-            json.load(f)
     except json.JSONDecodeError as e:
         printError(f"Invalid JSON syntax: {e}")
         return 1
@@ -173,12 +629,19 @@ def validateRepositories(configPath: str) -> int:
         printError(f"Error reading config: {e}")
         return 1
 
+    printH2("Validating Repositories Config")
+    safePrint()
+
+    if not isinstance(config, dict):
+        printError("Config must be a JSON object")
+        return 1
+
     errors = 0
 
     # Validate work paths
     printInfo("Validating work paths...")
-    workPathUnix = getJsonValue(configPath, ".workPathUnix", "")
-    workPathWindows = getJsonValue(configPath, ".workPathWindows", "")
+    workPathUnix = config.get("workPathUnix") or ""
+    workPathWindows = config.get("workPathWindows") or ""
 
     if not workPathUnix and not workPathWindows:
         printError("Missing workPathUnix or workPathWindows")
@@ -204,112 +667,119 @@ def validateRepositories(configPath: str) -> int:
 
     # Validate repositories
     printInfo("Validating repositories...")
-    repositories = getJsonArray(configPath, ".repositories[]?")
+    repositories = config.get("repositories") or []
+
+    if not isinstance(repositories, list):
+        printError("repositories must be an array")
+        return 1
 
     if not repositories:
         printWarning("No repositories specified")
         return 0
 
     # Check if git is available
-    if not commandExists("git"):
+    if not _gitAvailable():
         printWarning("git is not available. Cannot validate repository existence.")
         printInfo("Repositories will be validated at clone time.")
         return 0
 
-    repoCount = 0
-
+    # Pass 1: classify each distinct repository, without any I/O.
+    # Entries naming the same repository share a canonical URL and are checked once.
+    uniqueUrls: Dict[str, Tuple[str, str, Optional[str]]] = {}
     for entry in repositories:
-        if not entry:
-            continue
+        if isinstance(entry, str) and entry.strip():
+            repoUrl = entry.strip()
+            canonicalUrl = canonicalizeRepoUrl(repoUrl)
+            if canonicalUrl not in uniqueUrls:
+                uniqueUrls[canonicalUrl] = (repoUrl, *classifyRepoUrl(repoUrl))
 
-        # Handle object format (wildcard support)
-        if isinstance(entry, dict):
-            pattern = entry.get('pattern', '')
-            visibility = entry.get('visibility', 'all')
+    repoCount = 0
 
-            if not pattern:
-                printError("Repository object missing 'pattern' field")
-                errors += 1
+    with ThreadPoolExecutor(max_workers=max(1, min(MAX_WORKERS, len(uniqueUrls)))) as executor:
+        # Pass 2: other hosts are checked on the pool straight away...
+        checks: Dict[str, Future] = {}
+        for canonicalUrl, (repoUrl, kind, _) in uniqueUrls.items():
+            if kind in ("http", "git"):
+                checks[canonicalUrl] = executor.submit(checkRepository, repoUrl, kind)
+
+        # ...while GitHub repositories are looked up in bulk, with individual
+        # API calls only for those the bulk lookup could not answer
+        githubRepos = {
+            canonicalUrl: (repoUrl, ownerRepo)
+            for canonicalUrl, (repoUrl, kind, ownerRepo) in uniqueUrls.items()
+            if kind == "github"
+        }
+        githubResults = checkGitHubRepositories([ownerRepo for _, ownerRepo in githubRepos.values()])
+        for canonicalUrl, (repoUrl, ownerRepo) in githubRepos.items():
+            checks[canonicalUrl] = executor.submit(checkRepository, repoUrl, "github", ownerRepo, githubResults)
+
+        for entry in repositories:
+            if not entry:
                 continue
 
-            repoCount += 1
-            printInfo(f"Checking pattern: {pattern} (visibility: {visibility})")
+            # Handle object format (wildcard support)
+            if isinstance(entry, dict):
+                pattern = entry.get('pattern', '')
+                visibility = entry.get('visibility', 'all')
 
-            # Validate visibility
-            if visibility not in ('all', 'public', 'private'):
-                printError(f"Invalid visibility: {visibility} (must be all/public/private)")
-                errors += 1
-                continue
+                if not pattern:
+                    printError("Repository object missing 'pattern' field")
+                    errors += 1
+                    continue
 
-            # Validate wildcard pattern format
-            if '*' in pattern:
-                if re.match(r'^(https://github\.com/|git@github\.com:)[^/]+/\*$', pattern):
-                    printSuccess(f"Valid wildcard pattern")
-                else:
-                    printError(f"Invalid wildcard pattern format")
-                    printError(f"Valid formats: git@github.com:owner/* or https://github.com/owner/*")
+                repoCount += 1
+                printInfo(f"Checking pattern: {pattern} (visibility: {visibility})")
+
+                # Validate visibility
+                if visibility not in ('all', 'public', 'private'):
+                    printError(f"Invalid visibility: {visibility} (must be all/public/private)")
                     errors += 1
-            else:
-                # Regular URL in object format - validate as normal
-                repoUrl = pattern
-                if re.match(r'^(https?|git)://|^git@', repoUrl):
-                    printSuccess(f"Valid URL format")
+                    continue
+
+                # Validate wildcard pattern format
+                if '*' in pattern:
+                    if _WILDCARD_PATTERN.match(pattern):
+                        printSuccess(f"Valid wildcard pattern")
+                    else:
+                        printError(f"Invalid wildcard pattern format")
+                        printError(f"Valid formats: git@github.com:owner/* or https://github.com/owner/*")
+                        errors += 1
                 else:
-                    printError(f"Invalid URL format")
-                    errors += 1
-
-            continue
+                    # Regular URL in object format - validate as normal
+                    repoUrl = pattern
+                    if repoUrl.startswith(_REPO_URL_PREFIXES):
+                        printSuccess(f"Valid URL format")
+                    else:
+                        printError(f"Invalid URL format")
+                        errors += 1
 
-        # Handle string format (backward compatible)
-        if not isinstance(entry, str) or not entry.strip():
-            printError(f"Invalid repository entry: {entry}")
-            errors += 1
-            continue
+                continue
 
-        repoUrl = entry.strip()
-        repoCount += 1
-        printInfo(f"Checking: {repoUrl}")
+            # Handle string format (backward compatible)
+            if not isinstance(entry, str) or not entry.strip():
+                printError(f"Invalid repository entry: {entry}")
+                errors += 1
+                continue
 
-        # Validate URL format
-        if re.match(r'^(https?|git)://|^git@', repoUrl):
-            # Convert SSH URL to HTTPS for validation (if it's a GitHub URL)
-            checkUrl = convertSshToHttps(repoUrl)
+            repoUrl = entry.strip()
+            repoCount += 1
+            printInfo(f"Checking: {repoUrl}")
+
+            # Results are printed in config order as each one becomes available;
+            # invalid and non-GitHub SSH URLs need no I/O and are resolved here
+            canonicalUrl = canonicalizeRepoUrl(repoUrl)
+            check = checks.get(canonicalUrl)
+            if check is not None:
+                status, message = check.result()
+            else:
+                firstUrl, kind, _ = uniqueUrls[canonicalUrl]
+                status, message = checkRepository(firstUrl, kind)
 
-            if checkUrl:
-                # Check GitHub repository via API
-                ownerRepo = checkUrl.replace("https://github.com/", "")
-                exists, message = checkGitHubRepository(ownerRepo)
+            _REPORTERS[status](message)
+            if status == "error":
+                errors += 1
 
-                if exists:
-                    printSuccess(f"Repository exists")
-                elif exists is None:
-                    printWarning(f"{message} - will be validated at clone time")
-                else:
-                    printWarning(f"{message} - will be validated at clone time")
-            elif repoUrl.startswith("git@"):
-                # Other SSH URLs - can't easily validate without SSH keys
-                printWarning("SSH URL detected - cannot validate without SSH keys (format is valid)")
-            elif repoUrl.startswith("https://github.com/"):
-                # Direct GitHub HTTPS URL
-                ownerRepo = repoUrl.replace("https://github.com/", "").replace(".git", "")
-                exists, message = checkGitHubRepository(ownerRepo)
-
-                if exists:
-                    printSuccess(f"Repository exists")
-                elif exists is None:
-                    printWarning(f"{message} - will be validated at clone time")
-                else:
-                    printWarning(f"{message} - will be validated at clone time")
-            else:
-                # Other HTTPS/Git URLs - try git ls-remote
-                if checkGitRepository(repoUrl):
-                    printSuccess(f"Repository exists")
-                else:
-                    printError(f"Repository not accessible or does not exist")
-                    errors += 1
-        else:
-            printError(f"Invalid repository URL format")
-            errors += 1
+    _githubCache.save()
 
     safePrint()
     printInfo(f"Checked {repoCount} repository/repositories")